@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+Latency of AttributeIndex filter queries, compared to a scan of the TranslationEntry properties.
+
+The translations cycle through the samples, so each value matches a tenth of them (or none, for a rare value).
+Run with: python benchmarks/attribute_index.py [--count N]
+"""
+
+# import built-in module
+import argparse
+import time
+import warnings
+
+# import third-party modules
+
+# import your own module
+from pons_dictionary.attribute_index import AttributeIndex
+from pons_dictionary.translation import parse_translations
+
+import corpus
+
+QUERIES = [
+    {"topic": "computing", "subject": "Verbindung, Verarbeitung"},
+    {"style": "informal"},
+    {"region": "Australian English"},
+]
+
+
+def scan(translations, criteria):
+    def matches(translation, field, value):
+        for entry in (translation.source, translation.target):
+            values = getattr(entry, field) if entry is not None else None
+            if values == value or (isinstance(values, list) and value in values):
+                return True
+        return False
+
+    return [translation for translation in translations
+            if all(matches(translation, field, value) for field, value in criteria.items())]
+
+
+def timed(function, *args, repeat: int = 3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=200000)
+    args = parser.parse_args()
+    warnings.simplefilter("ignore")
+
+    translations = parse_translations(corpus.translations(args.count))
+    elapsed, index = timed(AttributeIndex, translations, repeat=1)
+    print(f"index: {elapsed:.2f}s for {args.count} translations")
+
+    print(f"{'query':<64}{'results':>8}{'scan':>12}{'index':>12}")
+    for criteria in QUERIES:
+        scan_elapsed, expected = timed(scan, translations, criteria)
+        index_elapsed, result = timed(lambda: index.filter(**criteria))
+        assert result == expected
+        print(f"{str(criteria):<64}{len(result):>8}{scan_elapsed * 1e3:>10.2f}ms{index_elapsed * 1e3:>10.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
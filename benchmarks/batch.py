@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+Throughput of parse_translations compared to creating each Translation in a loop.
+
+Run with: python benchmarks/batch.py [--count N]
+"""
+
+# import built-in module
+import argparse
+import gc
+import time
+import warnings
+
+# import third-party modules
+
+# import your own module
+from pons_dictionary.translation import Translation, parse_translations
+
+import corpus
+
+
+def translations_per_second(parse, objs, repeat: int = 3) -> float:
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        parse(objs)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return len(objs) / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+    warnings.simplefilter("ignore")
+
+    print(f"{'':<24}{'loop':>14}{'batch':>14}")
+    for name, unique in [("recurring strings", False), ("unique strings", True)]:
+        objs = corpus.translations(args.count, unique=unique)
+        loop = translations_per_second(lambda batch: [Translation(obj) for obj in batch], objs)
+        batch = translations_per_second(parse_translations, objs)
+        print(f"{name:<24}{loop:>12.0f}/s{batch:>12.0f}/s")
+
+
+if __name__ == "__main__":
+    main()
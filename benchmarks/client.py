@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Latency of sequential PonsDictionary lookups on a reused connection, compared to a new connection per lookup.
+
+The lookups are sent to a local stub of the PONS API, so the measured latency excludes the network round trip to PONS
+but includes the connection setup that a reused connection saves.
+Run with: python benchmarks/client.py [--count N]
+"""
+
+# import built-in module
+import argparse
+import http.server
+import json
+import statistics
+import threading
+import time
+import warnings
+
+# import third-party modules
+
+# import your own module
+from pons_dictionary.dictionary import PonsDictionary
+
+import corpus
+
+RESPONSE = json.dumps([{"lang": "en", "hits": [{"type": "entry", "roms": [
+    {"headword": "ad", "arabs": [{"header": "", "translations": corpus.TRANSLATIONS}]}]}]}]).encode("utf-8")
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(RESPONSE)))
+        self.end_headers()
+        self.wfile.write(RESPONSE)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def latencies(search, count: int):
+    results = []
+    for _ in range(count):
+        start = time.perf_counter()
+        search()
+        results.append(time.perf_counter() - start)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=1000)
+    args = parser.parse_args()
+    warnings.simplefilter("ignore")
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/v1/dictionary"
+
+    def new_connection_search():
+        with PonsDictionary("en", "fr", "SECRET", base_url=url) as new_dictionary:
+            new_dictionary.search("ad")
+
+    with PonsDictionary("en", "fr", "SECRET", base_url=url) as dictionary:
+        results = {"reused connection": latencies(lambda: dictionary.search("ad"), args.count),
+                   "new connection": latencies(new_connection_search, args.count)}
+    server.shutdown()
+
+    print(f"{'':<20}{'mean':>10}{'p50':>10}{'p99':>10}")
+    for name, values in results.items():
+        values.sort()
+        print(f"{name:<20}{statistics.mean(values) * 1e3:>8.3f}ms{values[len(values) // 2] * 1e3:>8.3f}ms"
+              f"{values[int(len(values) * 0.99)] * 1e3:>8.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
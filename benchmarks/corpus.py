@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+Sample PONS translation objects shared by the benchmarks, from the recorded corpus of the tests.
+"""
+
+# import built-in module
+import itertools
+import json
+import pathlib
+import typing
+
+# import third-party modules
+
+# import your own module
+from pons_dictionary.reader import _walk_response
+
+# Recorded PONS API responses (shortened), also used by the benchmarks of the test suite
+CORPUS_PATH = pathlib.Path(__file__).resolve().parent.parent / "tests" / "corpus.json"
+
+with open(CORPUS_PATH, encoding="utf-8") as _fp:
+    TRANSLATIONS = [translation for response in json.load(_fp) for _, translation in _walk_response(response)]
+
+
+def translations(count: int, unique: bool = False) -> typing.List[dict]:
+    """
+    Returns count translation objects, cycling through the samples. Each object and string is a fresh copy, as it
+    would be after decoding an API response. If unique is True, a number is appended to every string so that no two
+    strings are equal.
+    """
+    objs = []
+    for i, obj in enumerate(itertools.islice(itertools.cycle(TRANSLATIONS), count)):
+        suffix = f" {i}" if unique else ""
+        objs.append({key: "".join(list(value)) + suffix for key, value in obj.items()})
+    return objs
+
+
+def entries(count: int) -> typing.List[str]:
+    """
+    Returns count API strings, alternating sources and targets of the samples.
+    """
+    return [value for obj in translations((count + 1) // 2) for value in obj.values()][:count]
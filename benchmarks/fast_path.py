@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+Throughput of TranslationEntry on a mixed corpus, with and without the fast path for plain strings and trailing spans.
+
+The mixed corpus holds the source and target strings of the sample translations: half of them are targets, most of
+which are plain text or text followed by a genus.
+Run with: python benchmarks/fast_path.py [--count N]
+"""
+
+# import built-in module
+import argparse
+import gc
+import time
+import typing
+import warnings
+
+# import third-party modules
+
+# import your own module
+import pons_dictionary.translation_entry as pons_translation_entry
+from pons_dictionary.translation_entry import TranslationEntry
+
+import corpus
+
+
+def entries_per_second(api_strs) -> float:
+    gc.collect()
+    start = time.perf_counter()
+    for api_str in api_strs:
+        TranslationEntry(api_str)
+    return len(api_strs) / (time.perf_counter() - start)
+
+
+def compare(api_strs, repeat: int = 7) -> typing.Tuple[float, float]:
+    """
+    Returns the best throughput with the full parse and with the fast path, measured alternately so that both see the
+    same load on the machine.
+    """
+    full_parse = fast_path = 0.0
+    for _ in range(repeat):
+        pons_translation_entry._parse = pons_translation_entry._parse_tags
+        full_parse = max(full_parse, entries_per_second(api_strs))
+        pons_translation_entry._parse = pons_translation_entry._parse_api_str
+        fast_path = max(fast_path, entries_per_second(api_strs))
+    return full_parse, fast_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+    warnings.simplefilter("ignore")
+
+    objs = corpus.translations(args.count // 2)
+    sources = [obj["source"] for obj in objs]
+    targets = [obj["target"] for obj in objs]
+    corpora = {"plain": [api_str for api_str in targets if "<" not in api_str],
+               "trailing span": [api_str for api_str in targets
+                                 if pons_translation_entry._TRAILING_SPAN_PATTERN.match(api_str)],
+               "other markup": sources,
+               "mixed": [api_str for obj in objs for api_str in obj.values()]}
+
+    print(f"{'':<16}{'share':>8}{'full parse':>14}{'fast path':>14}{'speedup':>10}")
+    for name, api_strs in corpora.items():
+        full_parse, fast_path = compare(api_strs)
+        share = len(api_strs) / args.count
+        print(f"{name:<16}{share:>8.0%}{full_parse:>12.0f}/s{fast_path:>12.0f}/s{fast_path / full_parse:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
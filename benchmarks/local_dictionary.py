@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+Open time and search latency of a LocalDictionary index.
+
+An index of random pseudo-words (each with a sample translation) is built in a temporary directory, then searched for
+present and absent headwords, by prefix (a present headword cut to 1 to 4 characters) and with fuzzy search (a present
+headword with a typo).
+Run with: python benchmarks/local_dictionary.py [--headwords N] [--count N]
+"""
+
+# import built-in module
+import argparse
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+import typing
+import warnings
+
+# import third-party modules
+
+# import your own module
+from pons_dictionary.local_dictionary import LocalDictionary, build_index
+
+import corpus
+
+
+LETTERS = "eeeeaaaiiioootttnnsshrdlcumwfgypbvk"
+
+
+def pseudo_words(count: int, rng: random.Random) -> typing.List[str]:
+    words = set()
+    while len(words) < count:
+        words.add("".join(rng.choice(LETTERS) for _ in range(rng.randint(3, 12))))
+    return sorted(words)
+
+
+def typo(word: str, rng: random.Random) -> str:
+    i = rng.randrange(len(word))
+    return word[:i] + rng.choice(LETTERS) + word[i + 1:]
+
+
+def write_responses(directory: str, headwords: typing.List[str]) -> None:
+    with open(os.path.join(directory, "responses.jsonl"), "w", encoding="utf-8") as fp:
+        for i, headword in enumerate(headwords):
+            translations = [corpus.TRANSLATIONS[i % len(corpus.TRANSLATIONS)]]
+            fp.write(json.dumps([{"lang": "en", "hits": [{"type": "entry", "opendict": False, "roms": [
+                {"headword": headword, "arabs": [{"header": "", "translations": translations}]}]}]}]) + "\n")
+
+
+def latencies(search, terms):
+    results = []
+    for term in terms:
+        start = time.perf_counter()
+        search(term)
+        results.append(time.perf_counter() - start)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--headwords", type=int, default=500000)
+    parser.add_argument("--count", type=int, default=1000)
+    args = parser.parse_args()
+    warnings.simplefilter("ignore")
+    rng = random.Random(0)
+    headwords = pseudo_words(args.headwords, rng)
+
+    with tempfile.TemporaryDirectory() as directory:
+        write_responses(directory, headwords)
+        index_path = os.path.join(directory, "index.bin")
+        start = time.perf_counter()
+        build_index(directory, index_path)
+        print(f"build: {time.perf_counter() - start:.1f}s for {args.headwords} headwords, "
+              f"{os.path.getsize(index_path) / 2 ** 20:.1f} MiB")
+
+        start = time.perf_counter()
+        dictionary = LocalDictionary(index_path)
+        print(f"open: {(time.perf_counter() - start) * 1e3:.3f}ms")
+
+        present = [rng.choice(headwords) for _ in range(args.count)]
+        absent = [word + "x" for word in present]
+        prefixes = [word[:rng.randint(1, 4)] for word in present]
+        typos = [typo(word, rng) for word in present]
+
+        start = time.perf_counter()
+        dictionary.search_fuzzy("")
+        print(f"first fuzzy search: {(time.perf_counter() - start) * 1e3:.1f}ms")
+
+        results = {"present": latencies(dictionary.search, present),
+                   "absent": latencies(dictionary.search, absent),
+                   "prefix (10)": latencies(lambda prefix: dictionary.search_prefix(prefix, limit=10), prefixes),
+                   "fuzzy (1)": latencies(lambda term: dictionary.search_fuzzy(term, 1, limit=10), typos),
+                   "fuzzy (2)": latencies(lambda term: dictionary.search_fuzzy(term, 2, limit=10), typos[:100])}
+        dictionary.close()
+
+    print(f"{'':<15}{'mean':>10}{'p50':>10}{'p99':>10}")
+    for name, values in results.items():
+        values.sort()
+        print(f"{name:<15}{statistics.mean(values) * 1e3:>8.3f}ms{values[len(values) // 2] * 1e3:>8.3f}ms"
+              f"{values[int(len(values) * 0.99)] * 1e3:>8.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+Memory footprint of parsed TranslationEntry and Translation objects.
+
+Compares them with the classes before the optimizations of the parser (see baseline.py), which stored every parsed
+field as an attribute in a per-instance __dict__. Entries are larger than before: slotting removed their __dict__, but
+each entry holds a parse result with all its fields (and its hints), and free-form values are not shared. Entries of
+recurring API strings only get smaller when they share their parse result, with the parse cache. Also compares the
+memory retained by translations with and without their raw payloads, once the decoded response is released.
+Run with: python benchmarks/memory.py [--count N]
+"""
+
+# import built-in module
+import argparse
+import gc
+import tracemalloc
+import warnings
+
+# import third-party modules
+
+# import your own module
+from pons_dictionary.translation import Translation
+from pons_dictionary.translation_entry import TranslationEntry, disable_parse_cache, enable_parse_cache
+
+import baseline
+import corpus
+
+
+def bytes_per_object(factory, inputs) -> float:
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    objects = [factory(obj) for obj in inputs]
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return (end - start) / len(inputs)
+
+
+def retained_bytes_per_translation(count: int, keep_raw: bool) -> float:
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    objs = corpus.translations(count, unique=True)
+    translations = [Translation(obj, keep_raw=keep_raw) for obj in objs]
+    del objs
+    gc.collect()
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del translations
+    return (end - start) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+    warnings.simplefilter("ignore")
+
+    entries = corpus.entries(args.count)
+    translations = corpus.translations(args.count)
+    print(f"{'':<20}{'baseline':>16}{'current':>16}{'parse cache':>16}")
+    for name, before, after, inputs in [("TranslationEntry", baseline.TranslationEntry, TranslationEntry, entries),
+                                        ("Translation", baseline.Translation, Translation, translations)]:
+        before_bytes = bytes_per_object(before, inputs)
+        after_bytes = bytes_per_object(after, inputs)
+        enable_parse_cache()
+        cached_bytes = bytes_per_object(after, inputs)
+        disable_parse_cache()
+        print(f"{name:<20}{before_bytes:>14.0f} B{after_bytes:>14.0f} B{cached_bytes:>14.0f} B")
+
+    print()
+    print(f"{'':<20}{'keep_raw=True':>16}{'keep_raw=False':>16}")
+    print(f"{'Translation':<20}{retained_bytes_per_translation(args.count, True):>14.0f} B"
+          f"{retained_bytes_per_translation(args.count, False):>14.0f} B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+Scaling of parse_translations_parallel with the number of worker processes.
+
+Run with: python benchmarks/parallel.py [--count N] [--workers 1 2 4 8]
+"""
+
+# import built-in module
+import argparse
+import time
+import warnings
+
+# import third-party modules
+
+# import your own module
+from pons_dictionary.translation import parse_translations, parse_translations_parallel
+
+import corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+    warnings.simplefilter("ignore")
+
+    objs = corpus.translations(args.count, unique=True)
+    start = time.perf_counter()
+    parse_translations(objs)
+    serial = time.perf_counter() - start
+    print(f"{'serial':<12}{args.count / serial:>12.0f}/s")
+
+    for workers in args.workers:
+        start = time.perf_counter()
+        parse_translations_parallel(objs, max_workers=workers)
+        elapsed = time.perf_counter() - start
+        print(f"{f'{workers} workers':<12}{args.count / elapsed:>12.0f}/s  speedup {serial / elapsed:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+Size and load time of parsed translations serialized with pons_dictionary.serialization.
+
+Compares dumps/loads with pickling the Translation objects, and with storing the translation objects as JSON and
+parsing them again on load. Translations are sample objects, either repeating (as in a cache of similar responses)
+or with unique strings (as in a dictionary, where most API strings appear once).
+Run with: python benchmarks/serialization.py [--count N]
+"""
+
+# import built-in module
+import argparse
+import json
+import pickle
+import time
+import warnings
+
+# import third-party modules
+
+# import your own module
+from pons_dictionary.serialization import dumps, loads
+from pons_dictionary.translation import Translation, parse_translations
+
+import corpus
+
+
+def best_time(function, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+    warnings.simplefilter("ignore")
+
+    for unique in (False, True):
+        objs = corpus.translations(args.count, unique=unique)
+        translations = [Translation(obj) for obj in objs]
+        formats = {
+            "pickle": (pickle.dumps(translations, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads),
+            "JSON + parsing": (json.dumps(objs, ensure_ascii=False).encode("utf-8"),
+                               lambda data: parse_translations(json.loads(data))),
+            "dumps/loads": (dumps(translations), loads),
+        }
+        assert all(load(data) == translations for data, load in formats.values())
+
+        print(f"{args.count} translations" + (", unique strings" if unique else ""))
+        print(f"{'':<20}{'size':>12}{'load':>12}")
+        for name, (data, load) in formats.items():
+            print(f"{name:<20}{len(data) / args.count:>10.1f} B{best_time(lambda: load(data)) / args.count * 1e6:>10.2f}us")
+        print()
+
+
+if __name__ == "__main__":
+    main()
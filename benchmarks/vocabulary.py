@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+Memory used by a large collection of parsed TranslationEntry objects, with and without interning of field values.
+
+Run with: python benchmarks/vocabulary.py [--count N]
+"""
+
+# import built-in module
+import argparse
+import gc
+import tracemalloc
+import warnings
+
+# import third-party modules
+
+# import your own module
+import pons_dictionary.translation_entry
+from pons_dictionary.translation_entry import TranslationEntry
+
+import corpus
+
+
+def parsed_bytes(inputs) -> int:
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    objects = [TranslationEntry(api_str) for api_str in inputs]
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return end - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+    warnings.simplefilter("ignore")
+
+    inputs = corpus.entries(args.count)
+    interned = parsed_bytes(inputs)
+    pons_dictionary.translation_entry._intern = lambda value: value
+    not_interned = parsed_bytes(inputs)
+
+    print(f"{args.count} entries")
+    print(f"not interned: {not_interned / 2 ** 20:>8.1f} MiB ({not_interned / args.count:.0f} B/entry)")
+    print(f"interned:     {interned / 2 ** 20:>8.1f} MiB ({interned / args.count:.0f} B/entry)")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,3 +14,8 @@ except PackageNotFoundError:  # pragma: no cover
     __version__ = "unknown"
 finally:
     del version, PackageNotFoundError
+
+from pons_dictionary.attribute_index import AttributeIndex  # noqa: E402,F401
+from pons_dictionary.cache import ResponseCache  # noqa: E402,F401
+from pons_dictionary.dictionary import AsyncPonsDictionary, PonsApiError, PonsDictionary, search  # noqa: E402,F401
+from pons_dictionary.local_dictionary import LocalDictionary, build_index  # noqa: E402,F401
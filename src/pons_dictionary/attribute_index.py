@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+# import built-in module
+import array
+import bisect
+import typing
+
+# import third-party modules
+
+# import your own module
+from pons_dictionary.translation import Translation
+from pons_dictionary.translation_entry import AcronymResolver, get_acronym_resolver
+
+# Fields of TranslationEntry indexed by AttributeIndex
+_INDEXED_FIELDS = ("region", "style", "subject", "topic")
+
+
+def _entry_values(entry, resolver: AcronymResolver, field: str) -> typing.List[str]:
+    if entry is None:
+        return []
+    value = resolver.resolve(entry, field)
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return value
+    return [value]
+
+
+def _union(postings: typing.List[array.array]) -> array.array:
+    if len(postings) == 1:
+        return postings[0]
+    return array.array("I", sorted(set().union(*postings)))
+
+
+class AttributeIndex:
+    """
+    Inverted index of Translation objects by the region, style, subject and topic of their source and target, for
+    filter queries.
+
+    Each value of each field has a posting list: the sorted positions of the translations whose source or target has
+    this value. A query intersects the posting lists of its criteria, walking the shortest one and searching the others
+    by bisection, so that it runs in time proportional to the shortest list rather than to the number of translations.
+
+    Values are the ones of the TranslationEntry properties when the translation is added (e.g. region "British
+    English", style "informal", or "Brit" and "inf" if the acronym resolver abbreviates them).
+    """
+
+    def __init__(self, translations: typing.Iterable[Translation] = ()):
+        # Initialize attributes
+        self._translations = []
+        self._postings = {field: {} for field in _INDEXED_FIELDS}
+        for translation in translations:
+            self.add(translation)
+
+    def __len__(self) -> int:
+        return len(self._translations)
+
+    def __getitem__(self, i: int) -> Translation:
+        return self._translations[i]
+
+    def add(self, translation: Translation) -> int:
+        """
+        Adds a translation to the index, returns its position.
+        """
+        i = len(self._translations)
+        self._translations.append(translation)
+        resolver = get_acronym_resolver()
+        for field, postings in self._postings.items():
+            values = set(_entry_values(translation.source, resolver, field))
+            values.update(_entry_values(translation.target, resolver, field))
+            for value in values:
+                posting = postings.get(value)
+                if posting is None:
+                    posting = postings[value] = array.array("I")
+                posting.append(i)
+        return i
+
+    def values(self, field: str) -> typing.Dict[str, int]:
+        """
+        Returns the values of field found in the index, with their number of translations.
+        """
+        return {value: len(posting) for value, posting in self._get_postings(field).items()}
+
+    def _get_postings(self, field: str) -> typing.Dict[str, array.array]:
+        try:
+            return self._postings[field]
+        except KeyError:
+            raise ValueError(f"{field} is not indexed, expected one of {', '.join(_INDEXED_FIELDS)}") from None
+
+    def positions(self, **criteria: typing.Union[str, typing.Iterable[str]]) -> array.array:
+        """
+        Returns the sorted positions of the translations matching all criteria. A criterion is a field and a value,
+        or several values of which any matches, e.g. positions(region="British English", style=["informal", "slang"]).
+        """
+        if not criteria:
+            return array.array("I", range(len(self._translations)))
+        postings = []
+        for field, value in criteria.items():
+            field_postings = self._get_postings(field)
+            if isinstance(value, str):
+                value = (value,)
+            postings.append(_union([field_postings.get(v, array.array("I")) for v in value]))
+        postings.sort(key=len)
+
+        shortest, others = postings[0], postings[1:]
+        result = array.array("I")
+        starts = [0] * len(others)
+        for i in shortest:
+            for j, posting in enumerate(others):
+                # Positions are increasing: the search in each posting list resumes where the previous one stopped
+                start = starts[j] = bisect.bisect_left(posting, i, starts[j])
+                if start == len(posting) or posting[start] != i:
+                    break
+            else:
+                result.append(i)
+        return result
+
+    def filter(self, **criteria: typing.Union[str, typing.Iterable[str]]) -> typing.List[Translation]:
+        """
+        Returns the translations matching all criteria (see positions), in the order they were added.
+        """
+        return [self._translations[i] for i in self.positions(**criteria)]
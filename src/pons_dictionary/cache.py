@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+
+# import built-in module
+import json
+import sqlite3
+import threading
+import time
+import typing
+
+# import third-party modules
+
+# import your own module
+from pons_dictionary.translation import Translation
+from pons_dictionary.translation_entry import _PARSE_VERSION, TranslationEntry, _ParsedEntry
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    status INTEGER NOT NULL,
+    body BLOB NOT NULL,
+    parsed TEXT,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);
+"""
+
+
+def _entry_to_json(entry: typing.Optional[TranslationEntry]) -> typing.Optional[dict]:
+    if entry is None:
+        return None
+    # Fields are stored by name (fields that are None are left out), so that stored results stay valid when fields are
+    # added to the parse result, e.g. by a new span rule.
+    return {field: value for field, value in entry._get_parsed()._asdict().items() if value is not None}
+
+
+def _list_to_tuple(value):
+    if isinstance(value, list):
+        return tuple(_list_to_tuple(item) for item in value)
+    return value
+
+
+def _entry_from_json(api_str: typing.Optional[str], parsed: typing.Optional[dict]) \
+        -> typing.Optional[TranslationEntry]:
+    if parsed is None:
+        return None
+    # Fields with several values and tokens (with their hints) are stored as JSON lists, the parse result holds tuples.
+    # Fields missing from the stored result are None, fields no longer in the parse result are left out.
+    values = dict.fromkeys(_ParsedEntry._fields)
+    for field, value in parsed.items():
+        if field in values:
+            values[field] = _list_to_tuple(value)
+    return TranslationEntry._from_parsed(api_str, _ParsedEntry(**values))
+
+
+def _translations_to_list(translations: typing.List[Translation]) -> list:
+    return [[translation.raw, _entry_to_json(translation.source), _entry_to_json(translation.target)]
+            for translation in translations]
+
+
+def _translations_from_list(values: list) -> typing.List[Translation]:
+    return [Translation._from_entries(obj, _entry_from_json(obj.get("source"), source),
+                                      _entry_from_json(obj.get("target"), target))
+            for obj, source, target in values]
+
+
+def _translations_to_json(translations: typing.List[Translation]) -> str:
+    return json.dumps(_translations_to_list(translations), ensure_ascii=False)
+
+
+def _translations_from_json(data: str) -> typing.List[Translation]:
+    return _translations_from_list(json.loads(data))
+
+
+def _parsed_to_json(translations: typing.List[Translation]) -> str:
+    """
+    Returns the parsed translations of a response as stored in the cache, with the version of the parsing rules.
+    """
+    return json.dumps({"parse_version": _PARSE_VERSION, "translations": _translations_to_list(translations)},
+                      ensure_ascii=False)
+
+
+def _parsed_from_json(data: str) -> typing.Optional[typing.List[Translation]]:
+    """
+    Returns the translations stored by _parsed_to_json, or None if they were parsed by other parsing rules (or stored
+    by an older version of pons_dictionary, without the version of the parsing rules, possibly by position).
+    """
+    parsed = json.loads(data)
+    if not isinstance(parsed, dict) or parsed.get("parse_version") != _PARSE_VERSION:
+        return None
+    return _translations_from_list(parsed["translations"])
+
+
+class ResponseCache:
+    """
+    Persistent cache of PONS API responses in an SQLite database, for PonsDictionary.
+
+    Responses are stored under a key identifying the search (term, languages and options), with their status and body
+    and, if store_parsed is True, their parsed translations so that a cache hit does not parse the response again.
+    Responses older than ttl seconds are not used; when there are more than max_entries responses, the least recently
+    used ones are removed.
+
+    Several processes on the same host can share the database file, which is used in write-ahead logging mode. Within a
+    process, a cache can be shared by threads.
+
+    Properties:
+        hits: number of searches found in the cache
+        misses: number of searches not found in the cache
+    """
+
+    def __init__(self, path: str, ttl: typing.Optional[float] = None, max_entries: typing.Optional[int] = None,
+                 store_parsed: bool = True, clock: typing.Callable[[], float] = time.time):
+        # Initialize attributes
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._store_parsed = store_parsed
+        self._clock = clock
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> "ResponseCache":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+
+    def get(self, key: str) -> typing.Optional[typing.Tuple[int, bytes, typing.Optional[typing.List[Translation]]]]:
+        """
+        Returns the status, body and (if stored, with the parsing rules of this version of pons_dictionary) parsed
+        translations of the response cached under key, or None if there is none or it expired.
+        """
+        now = self._clock()
+        with self._lock:
+            row = self._connection.execute("SELECT status, body, parsed, created FROM responses WHERE key = ?",
+                                           (key,)).fetchone()
+            if row is None or (self._ttl is not None and now - row[3] > self._ttl):
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._connection.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+
+        status, body, parsed, _ = row
+        return status, body, None if parsed is None else _parsed_from_json(parsed)
+
+    def put(self, key: str, status: int, body: bytes, translations: typing.List[Translation]) -> None:
+        """
+        Stores a response under key, with its parsed translations if store_parsed is True. Expired responses and least
+        recently used responses above max_entries are removed.
+        """
+        parsed = _parsed_to_json(translations) if self._store_parsed else None
+        now = self._clock()
+        with self._lock:
+            connection = self._connection
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.execute("INSERT OR REPLACE INTO responses (key, status, body, parsed, created, accessed) "
+                                   "VALUES (?, ?, ?, ?, ?, ?)", (key, status, body, parsed, now, now))
+                if self._ttl is not None:
+                    connection.execute("DELETE FROM responses WHERE created < ?", (now - self._ttl,))
+                if self._max_entries is not None:
+                    connection.execute("DELETE FROM responses WHERE key IN (SELECT key FROM responses "
+                                       "ORDER BY accessed DESC LIMIT -1 OFFSET ?)", (self._max_entries,))
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
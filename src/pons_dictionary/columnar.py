@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+# import built-in module
+import array
+import typing
+
+# import third-party modules
+# numpy and pyarrow are optional (pip install pons_dictionary[columnar]), they are imported when needed.
+if typing.TYPE_CHECKING:
+    import numpy
+    import pyarrow
+
+# import your own module
+from pons_dictionary.translation import Translation
+from pons_dictionary.translation_entry import TranslationEntry
+
+# Fields of TranslationEntry exported as plain columns (high cardinality)
+_PLAIN_FIELDS = ("text", "colloc", "collocator", "sense", "subject")
+
+# Fields of TranslationEntry exported as dictionary-encoded columns (low cardinality)
+_DICTIONARY_FIELDS = ("type", "category", "region", "rhetoric", "style", "topic")
+
+# Separator of the values of fields with several values (e.g. topic ['commerce', 'law'] -> 'commerce; law')
+_VALUES_SEPARATOR = "; "
+
+
+class DictionaryColumn(typing.NamedTuple):
+    """
+    Dictionary-encoded column: row i has the value values[codes[i]], or None if codes[i] is -1.
+    """
+    codes: array.array
+    values: typing.List[str]
+
+    def decode(self) -> typing.List[typing.Optional[str]]:
+        return [None if code == -1 else self.values[code] for code in self.codes]
+
+
+def _field_to_str(value: typing.Union[typing.List[str], str, None]) -> typing.Optional[str]:
+    if isinstance(value, list):
+        return _VALUES_SEPARATOR.join(value)
+    return value
+
+
+def _encode(values: typing.Iterable[typing.Optional[str]]) -> DictionaryColumn:
+    codes = array.array("i")
+    value_codes = {None: -1}
+    for value in values:
+        code = value_codes.get(value)
+        if code is None:
+            code = value_codes[value] = len(value_codes) - 1
+        codes.append(code)
+    del value_codes[None]
+    return DictionaryColumn(codes, list(value_codes))
+
+
+def _entry_columns(entries: typing.List[typing.Optional[TranslationEntry]], prefix: str = "") -> dict:
+    columns = {}
+    for field in _PLAIN_FIELDS:
+        columns[prefix + field] = [None if entry is None else _field_to_str(getattr(entry, field))
+                                   for entry in entries]
+    for field in _DICTIONARY_FIELDS:
+        columns[prefix + field] = _encode(None if entry is None else _field_to_str(getattr(entry, field))
+                                          for entry in entries)
+    return columns
+
+
+def to_columns(objs: typing.Iterable[typing.Union[Translation, TranslationEntry]]) \
+        -> typing.Dict[str, typing.Union[typing.List[typing.Optional[typing.Any]], DictionaryColumn]]:
+    """
+    Turns Translation objects, or TranslationEntry objects, into columns: a dict mapping each column name to a list
+    with one value per object, or to a DictionaryColumn for the low-cardinality fields (type, category, region,
+    rhetoric, style, topic). Fields with several values are joined with "; ".
+
+    Columns of TranslationEntry objects are named after their fields (text, type, ...). Columns of Translation objects
+    are opendict and the fields of the source and target, prefixed with source_ and target_ (source_text, ...).
+    """
+    objs = list(objs)
+    if all(isinstance(obj, TranslationEntry) for obj in objs) and objs:
+        return _entry_columns(objs)
+    if not all(isinstance(obj, Translation) for obj in objs):
+        raise TypeError("Expected only Translation objects or only TranslationEntry objects")
+
+    columns = {"opendict": [translation.opendict for translation in objs]}
+    columns.update(_entry_columns([translation.source for translation in objs], prefix="source_"))
+    columns.update(_entry_columns([translation.target for translation in objs], prefix="target_"))
+    return columns
+
+
+def to_numpy(objs: typing.Iterable[typing.Union[Translation, TranslationEntry]]) \
+        -> typing.Tuple["numpy.ndarray", typing.Dict[str, typing.List[str]]]:
+    """
+    Turns Translation or TranslationEntry objects into a NumPy structured array with one record per object (see
+    to_columns for the fields). Dictionary-encoded fields are stored as int32 codes (-1 for None), the second element
+    of the returned tuple maps these fields to their list of values.
+    """
+    import numpy
+
+    objs = list(objs)
+    columns = to_columns(objs)
+    dtype = []
+    for name, column in columns.items():
+        if isinstance(column, DictionaryColumn):
+            dtype.append((name, numpy.int32))
+        else:
+            dtype.append((name, object))
+
+    records = numpy.empty(len(objs), dtype=dtype)
+    values = {}
+    for name, column in columns.items():
+        if isinstance(column, DictionaryColumn):
+            records[name] = numpy.asarray(column.codes, dtype=numpy.int32)
+            values[name] = column.values
+        else:
+            records[name] = column
+    return records, values
+
+
+def to_arrow(objs: typing.Iterable[typing.Union[Translation, TranslationEntry]]) -> "pyarrow.Table":
+    """
+    Turns Translation or TranslationEntry objects into a pyarrow Table (see to_columns for the columns), with
+    dictionary-typed columns for the dictionary-encoded fields.
+    """
+    import pyarrow
+
+    arrays = {}
+    for name, column in to_columns(objs).items():
+        if isinstance(column, DictionaryColumn):
+            indices = pyarrow.array([None if code == -1 else code for code in column.codes], type=pyarrow.int32())
+            arrays[name] = pyarrow.DictionaryArray.from_arrays(indices, pyarrow.array(column.values,
+                                                                                      type=pyarrow.string()))
+        elif name == "opendict":
+            arrays[name] = pyarrow.array(column, type=pyarrow.bool_())
+        else:
+            arrays[name] = pyarrow.array(column, type=pyarrow.string())
+    return pyarrow.table(arrays)
+
+
+def write_parquet(objs: typing.Iterable[typing.Union[Translation, TranslationEntry]], path: str, **kwargs) -> None:
+    """
+    Writes Translation or TranslationEntry objects to a Parquet file (see to_arrow). kwargs are passed to
+    pyarrow.parquet.write_table.
+    """
+    import pyarrow.parquet
+
+    pyarrow.parquet.write_table(to_arrow(objs), path, **kwargs)
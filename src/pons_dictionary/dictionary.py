@@ -0,0 +1,397 @@
+# -*- coding: utf-8 -*-
+
+# import built-in module
+import asyncio
+import concurrent.futures
+import functools
+import gzip
+import http.client
+import json
+import queue
+import threading
+import time
+import typing
+import urllib.parse
+
+# import third-party modules
+
+# import your own module
+from pons_dictionary.cache import ResponseCache
+from pons_dictionary.rate_limit import TokenBucket
+from pons_dictionary.reader import _walk_response
+from pons_dictionary.translation import Translation, parse_translations
+
+_API_URL = "https://api.pons.com/v1/dictionary"
+
+# Statuses of throttled requests: too many requests, service unavailable (daily limit exceeded)
+_THROTTLED_STATUSES = frozenset([429, 503])
+
+
+class PonsApiError(Exception):
+    """
+    Error response of the PONS Dictionary API.
+    """
+
+    def __init__(self, status: int, reason: str):
+        super().__init__(f"PONS API responded {status} {reason}")
+        self.status = status
+        self.reason = reason
+
+
+class _ConnectionPool:
+    """
+    Pool of persistent (keep-alive) HTTP connections to a single host, shared by threads. At most maxsize idle
+    connections are kept; connections are created as needed.
+    """
+
+    def __init__(self, scheme: str, host: str, port: typing.Optional[int], timeout: float, maxsize: int):
+        if scheme == "https":
+            self._connection_class = http.client.HTTPSConnection
+        elif scheme == "http":
+            self._connection_class = http.client.HTTPConnection
+        else:
+            raise ValueError(f"Unsupported URL scheme: {scheme}")
+        self._host = host
+        self._port = port
+        self._timeout = timeout
+        self._idle = queue.LifoQueue(maxsize=maxsize)
+
+    def get(self) -> typing.Tuple[http.client.HTTPConnection, bool]:
+        """
+        Returns a connection, and whether it was reused from the pool.
+        """
+        try:
+            return self._idle.get_nowait(), True
+        except queue.Empty:
+            return self._connection_class(self._host, self._port, timeout=self._timeout), False
+
+    def put(self, connection: http.client.HTTPConnection) -> None:
+        try:
+            self._idle.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class _Call:
+    """
+    Search in flight, whose result is shared with identical concurrent searches.
+    """
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class PonsDictionary:
+    """
+    Client of the PONS Dictionary API for one language pair.
+
+    Requests are sent over a pool of persistent connections (at most pool_size idle connections are kept), with gzip
+    compression and a timeout in seconds. Search results are returned as a list of Translation. The client can be
+    shared by threads, and used as a context manager to close its connections.
+
+    If a rate_limiter is given, each request (including retries) first takes a token from it; the same TokenBucket can
+    be shared by several clients using the same secret. Throttled requests (429, 503) are retried up to max_retries
+    times, after the delay of the Retry-After header or an exponential backoff (backoff_factor * 2 ** retry seconds, at
+    most max_backoff). A request is not retried if Retry-After asks for a longer wait than max_backoff (e.g. until the
+    daily quota is reset). While waiting, the rate limiter is paused so that other requests back off as well.
+
+    If a cache (see ResponseCache) is given, successful responses are stored in it and searches found in it are answered
+    without a request.
+
+    Identical searches made concurrently (e.g. by several threads) are coalesced: only the first one sends a request,
+    the others wait for and share its result.
+
+    Properties:
+        source_lang: language of the searched terms, e.g. "en"
+        target_lang: language of the translations, e.g. "fr"
+        dictionary: PONS dictionary code, by default both languages in alphabetical order, e.g. "enfr"
+        stats: counters of requests: queued (waiting for the rate limiter), in_flight, requests (sent), throttled
+            (responses), retries and deduplicated (searches coalesced with an identical search in flight)
+    """
+
+    def __init__(self, source_lang: str, target_lang: str, secret: str, dictionary: typing.Optional[str] = None,
+                 timeout: float = 10.0, pool_size: int = 4, base_url: str = _API_URL,
+                 rate_limiter: typing.Optional[TokenBucket] = None, max_retries: int = 3, backoff_factor: float = 0.5,
+                 max_backoff: float = 60.0, cache: typing.Optional[ResponseCache] = None):
+        # Initialize attributes
+        self._source_lang = source_lang
+        self._target_lang = target_lang
+        self._dictionary = dictionary if dictionary is not None else "".join(sorted([source_lang, target_lang]))
+        self._secret = secret
+
+        url = urllib.parse.urlsplit(base_url)
+        self._path = url.path
+        self._pool = _ConnectionPool(url.scheme, url.hostname, url.port, timeout, pool_size)
+
+        self._rate_limiter = rate_limiter
+        self._max_retries = max_retries
+        self._backoff_factor = backoff_factor
+        self._max_backoff = max_backoff
+        self._stats = {"queued": 0, "in_flight": 0, "requests": 0, "throttled": 0, "retries": 0, "deduplicated": 0}
+        self._stats_lock = threading.Lock()
+        self._cache = cache
+        self._calls = {}
+        self._calls_lock = threading.Lock()
+
+    def __enter__(self) -> "PonsDictionary":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the idle connections of the pool.
+        """
+        self._pool.close()
+
+    def _params(self, term: str, fuzzy: bool, references: bool) -> dict:
+        params = {"q": term, "l": self._dictionary, "in": self._source_lang}
+        if fuzzy:
+            params["fm"] = 1
+        if references:
+            params["ref"] = "true"
+        return params
+
+    @staticmethod
+    def _key(params: dict) -> str:
+        """
+        Returns the key identifying a search, for the cache and the coalescing of identical searches.
+        """
+        return urllib.parse.urlencode(sorted(params.items()))
+
+    def _count(self, counter: str, value: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[counter] += value
+
+    def _request(self, params: dict) -> typing.Tuple[int, str, typing.Optional[str], bytes]:
+        """
+        Sends a GET request with params, returns the status, reason, Retry-After header and (decompressed) body of the
+        response. A request on a reused connection that was closed by the server is retried once on a new connection.
+        """
+        url = self._path + "?" + urllib.parse.urlencode(params)
+        headers = {"X-Secret": self._secret, "Accept-Encoding": "gzip", "Connection": "keep-alive"}
+        while True:
+            connection, reused = self._pool.get()
+            try:
+                connection.request("GET", url, headers=headers)
+                response = connection.getresponse()
+                body = response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                connection.close()
+                if reused:
+                    continue
+                raise
+            except BaseException:
+                connection.close()
+                raise
+            if response.will_close:
+                connection.close()
+            else:
+                self._pool.put(connection)
+            if response.getheader("Content-Encoding") == "gzip":
+                body = gzip.decompress(body)
+            return response.status, response.reason, response.getheader("Retry-After"), body
+
+    def _retry_delay(self, retry: int, retry_after: typing.Optional[str]) -> typing.Optional[float]:
+        """
+        Returns the delay before a retry, or None if Retry-After asks for a longer wait than max_backoff.
+        """
+        if retry_after is not None and retry_after.isdigit():
+            delay = float(retry_after)
+            return delay if delay <= self._max_backoff else None
+        return min(self._max_backoff, self._backoff_factor * 2 ** retry)
+
+    def _send(self, params: dict) -> typing.Tuple[int, str, bytes]:
+        """
+        Sends a request through the rate limiter, retrying throttled requests. Returns the status, reason and body of
+        the last response.
+        """
+        retry = 0
+        while True:
+            if self._rate_limiter is not None:
+                self._count("queued")
+                try:
+                    self._rate_limiter.acquire()
+                finally:
+                    self._count("queued", -1)
+
+            self._count("in_flight")
+            self._count("requests")
+            try:
+                status, reason, retry_after, body = self._request(params)
+            finally:
+                self._count("in_flight", -1)
+
+            if status not in _THROTTLED_STATUSES:
+                return status, reason, body
+            self._count("throttled")
+            delay = self._retry_delay(retry, retry_after)
+            if retry >= self._max_retries or delay is None:
+                return status, reason, body
+
+            self._count("retries")
+            retry += 1
+            if self._rate_limiter is not None:
+                self._rate_limiter.pause(delay)
+            else:
+                time.sleep(delay)
+
+    @staticmethod
+    def _decode(status: int, reason: str, body: bytes) -> typing.List[Translation]:
+        if status == 204:
+            # No results
+            return []
+        if status != 200:
+            raise PonsApiError(status, reason)
+        return parse_translations(translation for _, translation in _walk_response(json.loads(body)))
+
+    def search(self, term: str, fuzzy: bool = False, references: bool = False) -> typing.List[Translation]:
+        """
+        Searches term in the dictionary, returns the translations found (an empty list if there are none). Raises
+        PonsApiError if the API responds with an error, or is still throttling the request after max_retries retries.
+        """
+        params = self._params(term, fuzzy, references)
+        key = self._key(params)
+
+        with self._calls_lock:
+            call = self._calls.get(key)
+            is_first = call is None
+            if is_first:
+                call = self._calls[key] = _Call()
+        if not is_first:
+            self._count("deduplicated")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return list(call.result)
+
+        try:
+            call.result = self._search(key, params)
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._calls_lock:
+                del self._calls[key]
+            call.done.set()
+        return list(call.result)
+
+    def _search(self, key: str, params: dict) -> typing.List[Translation]:
+        if self._cache is None:
+            return self._decode(*self._send(params))
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            status, body, translations = cached
+            return translations if translations is not None else self._decode(status, "", body)
+        status, reason, body = self._send(params)
+        translations = self._decode(status, reason, body)
+        self._cache.put(key, status, body, translations)
+        return translations
+
+    @property
+    def source_lang(self) -> str:
+        return self._source_lang
+
+    @property
+    def target_lang(self) -> str:
+        return self._target_lang
+
+    @property
+    def dictionary(self) -> str:
+        return self._dictionary
+
+    @property
+    def stats(self) -> typing.Dict[str, int]:
+        with self._stats_lock:
+            return dict(self._stats)
+
+
+class AsyncPonsDictionary:
+    """
+    asyncio counterpart of PonsDictionary.
+
+    At most max_concurrency searches are in flight at the same time, sharing one pool of persistent connections. The
+    standard library has no asynchronous HTTP client, so each search (the request and the parsing of the response into
+    Translation objects) runs in a thread of an executor, keeping both off the event loop. Identical concurrent
+    searches are coalesced into one, see PonsDictionary. kwargs are passed to PonsDictionary.
+
+    Properties:
+        dictionary: the PonsDictionary used for the searches
+    """
+
+    def __init__(self, source_lang: str, target_lang: str, secret: str, max_concurrency: int = 10, **kwargs):
+        # Initialize attributes
+        kwargs.setdefault("pool_size", max_concurrency)
+        self._dictionary = PonsDictionary(source_lang, target_lang, secret, **kwargs)
+        self._max_concurrency = max_concurrency
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency,
+                                                               thread_name_prefix="pons_dictionary")
+        self._semaphore = None
+        self._tasks = {}
+
+    async def __aenter__(self) -> "AsyncPonsDictionary":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Waits for the searches in flight, then closes the executor and the idle connections of the pool.
+        """
+        await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+        self._dictionary.close()
+
+    async def search(self, term: str, fuzzy: bool = False, references: bool = False) -> typing.List[Translation]:
+        """
+        Searches term in the dictionary, see PonsDictionary.search.
+        """
+        key = self._dictionary._key(self._dictionary._params(term, fuzzy, references))
+        task = self._tasks.get(key)
+        if task is None:
+            task = self._tasks[key] = asyncio.ensure_future(self._search(term, fuzzy, references))
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        else:
+            self._dictionary._count("deduplicated")
+        # A cancelled search does not cancel the task shared with identical searches
+        return list(await asyncio.shield(task))
+
+    async def _search(self, term: str, fuzzy: bool, references: bool) -> typing.List[Translation]:
+        if self._semaphore is None:
+            # Created here rather than in __init__, to be bound to the running event loop
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        async with self._semaphore:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, functools.partial(self._dictionary.search, term, fuzzy, references))
+
+    async def search_many(self, terms: typing.Iterable[str], fuzzy: bool = False, references: bool = False) \
+            -> typing.List[typing.List[Translation]]:
+        """
+        Searches each term concurrently, returns the translations found for each term in the same order.
+        """
+        return list(await asyncio.gather(*(self.search(term, fuzzy, references) for term in terms)))
+
+    @property
+    def dictionary(self) -> PonsDictionary:
+        return self._dictionary
+
+
+def search(term: str, source_lang: str, target_lang: str, secret: str, **kwargs) -> typing.List[Translation]:
+    """
+    Searches term with a PonsDictionary created for this search only. kwargs are passed to PonsDictionary.
+    """
+    with PonsDictionary(source_lang, target_lang, secret, **kwargs) as dictionary:
+        return dictionary.search(term)
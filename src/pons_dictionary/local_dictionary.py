@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+
+# import built-in module
+import argparse
+import bisect
+import mmap
+import os
+import struct
+import sys
+import typing
+
+# import third-party modules
+
+# import your own module
+from pons_dictionary.cache import _translations_from_json, _translations_to_json
+from pons_dictionary.reader import _iter_json_values, _walk_response
+from pons_dictionary.translation import Translation, parse_translations
+from pons_dictionary.translation_entry import _PARSE_VERSION, collect_diagnostics
+
+# Index file layout (integers are little-endian):
+# - header: magic, version, version of the parsing rules of the translations, number of headwords
+# - one record per headword, sorted by UTF-8 encoded headword: offset and length of the headword, offset and length of
+#   its translations
+# - headwords (UTF-8), then translations (UTF-8 JSON, see pons_dictionary.cache)
+_MAGIC = b"PONSIDX"
+# Version 2 stores parse results by field name, version 3 the version of the parsing rules
+_VERSION = 3
+_HEADER = struct.Struct("<7sBIQ")
+# Magic and version, at the start of the header of all versions
+_HEADER_START = struct.Struct("<7sB")
+_RECORD = struct.Struct("<QIQI")
+
+_RESPONSE_FILE_EXTENSIONS = (".json", ".jsonl")
+
+
+def _headword(rom_headword: typing.Optional[str], translation: Translation) -> typing.Optional[str]:
+    """
+    Returns the headword under which a translation is indexed: the headword of its rom, or for hits without roms, the
+    text of its source if it is a headword.
+    """
+    if rom_headword is not None:
+        return rom_headword
+    if translation.source is not None and translation.source.type == "headword":
+        return translation.source.text
+    return None
+
+
+def _iter_response_files(directory: str) -> typing.Iterator[str]:
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for file in sorted(files):
+            if file.endswith(_RESPONSE_FILE_EXTENSIONS):
+                yield os.path.join(root, file)
+
+
+def build_index(directory: str, index_path: str) -> int:
+    """
+    Parses the PONS API responses of the .json and .jsonl files in directory (and its subdirectories) and writes an
+    index of their translations by headword to index_path. Identical translations found in several responses are
+    indexed once. Returns the number of headwords.
+    """
+    translations_by_headword = {}
+    # A single warning summarizes the unexpected patterns of all the responses
+    with collect_diagnostics():
+        for path in _iter_response_files(directory):
+            with open(path, encoding="utf-8") as fp:
+                for value in _iter_json_values(fp):
+                    found = list(_walk_response(value))
+                    translations = parse_translations(translation for _, translation in found)
+                    for (rom_headword, _), translation in zip(found, translations):
+                        headword = _headword(rom_headword, translation)
+                        if headword is not None:
+                            # dict used as an ordered set
+                            translations_by_headword.setdefault(headword, {})[translation] = None
+
+    keys = sorted(headword.encode("utf-8") for headword in translations_by_headword)
+    data = [_translations_to_json(list(translations_by_headword[key.decode("utf-8")])).encode("utf-8")
+            for key in keys]
+
+    with open(index_path, "wb") as fp:
+        fp.write(_HEADER.pack(_MAGIC, _VERSION, _PARSE_VERSION, len(keys)))
+        key_offset = _HEADER.size + _RECORD.size * len(keys)
+        data_offset = key_offset + sum(len(key) for key in keys)
+        for key, value in zip(keys, data):
+            fp.write(_RECORD.pack(key_offset, len(key), data_offset, len(value)))
+            key_offset += len(key)
+            data_offset += len(value)
+        for key in keys:
+            fp.write(key)
+        for value in data:
+            fp.write(value)
+    return len(keys)
+
+
+class _Headwords(typing.Sequence[bytes]):
+    """
+    Sorted UTF-8 encoded headwords of an index, read from the memory-mapped file on access.
+    """
+
+    def __init__(self, buffer: mmap.mmap, count: int):
+        self._buffer = buffer
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i: int) -> bytes:
+        if not 0 <= i < self._count:
+            raise IndexError(i)
+        key_offset, key_length, _, _ = _RECORD.unpack_from(self._buffer, _HEADER.size + _RECORD.size * i)
+        return self._buffer[key_offset:key_offset + key_length]
+
+
+class LocalDictionary:
+    """
+    Dictionary searching an index built by build_index (or the pons-build-index command) from cached PONS API responses,
+    without calling the API.
+
+    The index file is memory-mapped, so opening it is nearly free and searches (a binary search over the sorted
+    headwords) only read the pages they need. Can be used as a context manager to close the file.
+    """
+
+    def __init__(self, index_path: str):
+        with open(index_path, "rb") as fp:
+            self._buffer = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version = _HEADER_START.unpack_from(self._buffer, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self._buffer.close()
+            raise ValueError(f"{index_path} is not a pons_dictionary index (version {_VERSION})")
+        _, _, parse_version, count = _HEADER.unpack_from(self._buffer, 0)
+        if parse_version != _PARSE_VERSION:
+            self._buffer.close()
+            raise ValueError(f"{index_path} was built with other parsing rules, build it again (see build_index)")
+        self._headwords = _Headwords(self._buffer, count)
+        # Decoded headwords for search_fuzzy, read on its first call
+        self._headword_list = None
+
+    def __enter__(self) -> "LocalDictionary":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._headwords)
+
+    def __contains__(self, headword: str) -> bool:
+        return self._find(headword) is not None
+
+    def close(self) -> None:
+        self._buffer.close()
+
+    def _find(self, headword: str) -> typing.Optional[int]:
+        key = headword.encode("utf-8")
+        i = bisect.bisect_left(self._headwords, key)
+        if i < len(self._headwords) and self._headwords[i] == key:
+            return i
+        return None
+
+    def _translations(self, i: int) -> typing.List[Translation]:
+        _, _, data_offset, data_length = _RECORD.unpack_from(self._buffer, _HEADER.size + _RECORD.size * i)
+        return _translations_from_json(self._buffer[data_offset:data_offset + data_length].decode("utf-8"))
+
+    def headwords(self) -> typing.Iterator[str]:
+        """
+        Yields the headwords of the index, in the order of their UTF-8 encoding.
+        """
+        for key in self._headwords:
+            yield key.decode("utf-8")
+
+    def search_prefix(self, prefix: str, limit: typing.Optional[int] = None) -> typing.List[str]:
+        """
+        Returns the headwords starting with prefix (at most limit of them), in the order of headwords().
+        """
+        key = prefix.encode("utf-8")
+        headwords = []
+        for i in range(bisect.bisect_left(self._headwords, key), len(self._headwords)):
+            if len(headwords) == limit:
+                break
+            headword = self._headwords[i]
+            if not headword.startswith(key):
+                break
+            headwords.append(headword.decode("utf-8"))
+        return headwords
+
+    def search_fuzzy(self, term: str, max_distance: int = 1, limit: typing.Optional[int] = None) -> typing.List[str]:
+        """
+        Returns the headwords within max_distance edits (insertions, deletions or substitutions of a character) of
+        term, at most limit of them, closest first. Fast for max_distance=1; max_distance=2 visits about 20 times as many
+        prefixes of headwords.
+
+        The sorted headwords are searched as a trie, computing a row of the edit distance matrix per prefix. A prefix
+        more than max_distance edits away from every prefix of term is not extended, and a prefix exactly max_distance
+        edits away is only extended with the characters of term that keep it within max_distance.
+        """
+        if self._headword_list is None:
+            records = self._buffer[_HEADER.size:_HEADER.size + _RECORD.size * len(self._headwords)]
+            self._headword_list = [self._buffer[key_offset:key_offset + key_length].decode("utf-8")
+                                   for key_offset, key_length, _, _ in _RECORD.iter_unpack(records)]
+        headwords = self._headword_list
+
+        matches = []
+        # Distances above max_distance are stored as max_distance + 1: only the band of the matrix around its diagonal
+        # is computed.
+        above_max = max_distance + 1
+        # Prefix, its row of the edit distance matrix and the range of headwords starting with it
+        stack = [("", [min(j, above_max) for j in range(len(term) + 1)], 0, len(headwords))]
+        while stack:
+            prefix, row, lo, hi = stack.pop()
+            if lo < hi and headwords[lo] == prefix:
+                if row[-1] <= max_distance:
+                    matches.append((row[-1], prefix))
+                lo += 1
+
+            depth = len(prefix)
+            children = []
+            if min(row) < max_distance:
+                while lo < hi:
+                    char = headwords[lo][depth]
+                    end = bisect.bisect_left(headwords, prefix + chr(ord(char) + 1), lo, hi)
+                    children.append((char, lo, end))
+                    lo = end
+            else:
+                for char in sorted({term[j] for j in range(len(term)) if row[j] == max_distance}):
+                    start = bisect.bisect_left(headwords, prefix + char, lo, hi)
+                    lo = bisect.bisect_left(headwords, prefix + chr(ord(char) + 1), start, hi)
+                    if start < lo:
+                        children.append((char, start, lo))
+
+            for char, start, end in reversed(children):
+                child_row = [above_max] * len(row)
+                child_row[0] = min(depth + 1, above_max)
+                closest = child_row[0]
+                for j in range(max(1, depth + 1 - max_distance), min(len(term), depth + 1 + max_distance) + 1):
+                    distance = min(child_row[j - 1] + 1, row[j] + 1, row[j - 1] + (term[j - 1] != char))
+                    child_row[j] = distance
+                    if distance < closest:
+                        closest = distance
+                if closest <= max_distance:
+                    stack.append((prefix + char, child_row, start, end))
+        matches.sort()
+        return [headword for _, headword in matches[:limit]]
+
+    def search(self, headword: str) -> typing.List[Translation]:
+        """
+        Returns the translations indexed under headword (an empty list if there are none).
+        """
+        i = self._find(headword)
+        if i is None:
+            return []
+        return self._translations(i)
+
+
+def main(args: typing.List[str]) -> None:
+    parser = argparse.ArgumentParser(description="Builds a pons_dictionary index from cached PONS API responses.")
+    parser.add_argument("directory", help="directory of PONS API responses (.json or .jsonl files)")
+    parser.add_argument("index", help="path of the index file to write")
+    parsed_args = parser.parse_args(args)
+    count = build_index(parsed_args.directory, parsed_args.index)
+    print(f"Indexed {count} headwords in {parsed_args.index}")
+
+
+def run() -> None:
+    """
+    Entry point of the pons-build-index command.
+    """
+    main(sys.argv[1:])
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+# import built-in module
+import threading
+import time
+import typing
+
+# import third-party modules
+
+# import your own module
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter, shared by threads (and by the searches of an AsyncPonsDictionary, which run in threads).
+
+    Tokens are added at rate tokens per second, up to capacity tokens (default: rate but at least 1, i.e. a burst of one
+    second of requests). Each request takes one token, waiting until one is available. E.g. for a quota of 1000 requests
+    per day spent at a steady pace: TokenBucket(rate=1000 / 86400, capacity=10).
+
+    When the API throttles a request, pause() stops handing out tokens for a while, so that all the threads sharing the
+    bucket back off together instead of each retrying on its own.
+    """
+
+    def __init__(self, rate: float, capacity: typing.Optional[float] = None,
+                 clock: typing.Callable[[], float] = time.monotonic,
+                 sleep: typing.Callable[[float], None] = time.sleep):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        # Initialize attributes
+        self._rate = rate
+        self._capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self._capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> float:
+        """
+        Adds the tokens accumulated since the last update, returns the current time.
+        """
+        now = self._clock()
+        if now > self._updated:
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+        return now
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """
+        Takes tokens if they are available, returns whether they were taken.
+        """
+        with self._lock:
+            now = self._refill()
+            if self._tokens >= tokens and now >= self._updated:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Takes tokens, waiting until they are available. Returns the time waited in seconds. Raises ValueError if tokens
+        is more than the capacity, as they would never be available.
+        """
+        if tokens > self._capacity:
+            raise ValueError(f"Cannot acquire {tokens} tokens from a bucket of capacity {self._capacity}")
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._refill()
+                if self._tokens >= tokens and now >= self._updated:
+                    self._tokens -= tokens
+                    return waited
+                wait = max(0.0, self._updated - now) + max(0.0, tokens - self._tokens) / self._rate
+            self._sleep(wait)
+            waited += wait
+
+    def pause(self, seconds: float) -> None:
+        """
+        Empties the bucket, and adds no tokens for seconds.
+        """
+        with self._lock:
+            now = self._refill()
+            self._tokens = min(self._tokens, 0.0)
+            self._updated = max(self._updated, now + seconds)
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    @property
+    def capacity(self) -> float:
+        return self._capacity
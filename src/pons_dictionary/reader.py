@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+# import built-in module
+import json
+import typing
+
+# import third-party modules
+
+# import your own module
+from pons_dictionary.translation import Translation
+
+_CHUNK_SIZE = 64 * 1024
+_WHITESPACE = " \t\n\r"
+# Characters that can follow the beginning of a JSON number
+_NUMBER_CHARS = "0123456789.eE+-"
+
+
+def _iter_json_values(fp: typing.TextIO, chunk_size: int = _CHUNK_SIZE) -> typing.Iterator[typing.Any]:
+    """
+    Reads whitespace-separated JSON values from fp (a single JSON document or JSON lines). The items of top-level
+    arrays are decoded and yielded one by one as they are read, so memory use is bounded by the size of the largest
+    item rather than by the size of the file.
+    """
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+    eof = False
+    read_size = chunk_size
+    in_array = False
+    need_separator = False
+
+    while True:
+        # Skip whitespace, and commas between array items
+        while True:
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buf) or eof:
+                break
+            buf = fp.read(read_size)
+            pos = 0
+            eof = not buf
+
+        if pos == len(buf):
+            if in_array:
+                raise ValueError("Unexpected end of file in JSON array")
+            return
+
+        char = buf[pos]
+        if in_array and char == "]":
+            in_array = False
+            pos += 1
+            continue
+        if in_array and need_separator:
+            if char != ",":
+                raise ValueError(f"Expected ',' or ']' in JSON array, got {char!r}")
+            need_separator = False
+            pos += 1
+            continue
+        if not in_array and char == "[":
+            in_array = True
+            need_separator = False
+            pos += 1
+            continue
+
+        # Decode one value, reading more of the file until it is complete
+        while True:
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+                # A number at the end of the buffer may continue in the rest of the file
+                if eof or (end < len(buf) and not (type(value) in (int, float) and
+                                                   not buf[end:].strip(_NUMBER_CHARS))):
+                    break
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            chunk = fp.read(read_size)
+            eof = not chunk
+            buf = buf[pos:] + chunk
+            pos = 0
+            read_size *= 2
+        read_size = chunk_size
+        pos = end
+        need_separator = in_array
+        yield value
+
+
+def _walk_response(value: typing.Any) -> typing.Iterator[typing.Tuple[typing.Optional[str], dict]]:
+    """
+    Walks the hits/roms/arabs/translations nesting of a PONS response (or of any part or list of responses), yielding
+    the headword of the rom (None for hits without roms) and the translation object, for each translation object.
+    Translation hits with their own source and target are translation objects themselves.
+    """
+    if isinstance(value, list):
+        for item in value:
+            yield from _walk_response(item)
+    elif isinstance(value, dict):
+        if "hits" in value:
+            yield from _walk_response(value["hits"])
+        for rom in value.get("roms", ()):
+            for arab in rom.get("arabs", ()):
+                for translation in arab.get("translations", ()):
+                    yield rom.get("headword"), translation
+        for translation in value.get("translations", ()):
+            yield None, translation
+        if "hits" not in value and ("source" in value or "target" in value):
+            yield None, value
+
+
+def iter_translations(fp: typing.TextIO, lazy: bool = False, keep_raw: bool = True) -> typing.Iterator[Translation]:
+    """
+    Reads PONS API responses from a file object, either a JSON document (one response or an array of responses) or
+    JSON lines (one response per line), and yields a Translation for each translation object they contain.
+
+    The file is read incrementally: memory use is bounded by the size of the largest item of a top-level array (e.g.
+    one language of a response, or one response of an array of responses), regardless of the size of the file. See
+    Translation for lazy and keep_raw.
+    """
+    for value in _iter_json_values(fp):
+        for _, translation in _walk_response(value):
+            yield Translation(translation, lazy=lazy, keep_raw=keep_raw)
+
+
+def read_translations(path: str, lazy: bool = False, keep_raw: bool = True) -> typing.Iterator[Translation]:
+    """
+    Opens the file at path and yields its translations, see iter_translations.
+    """
+    with open(path, encoding="utf-8") as fp:
+        yield from iter_translations(fp, lazy=lazy, keep_raw=keep_raw)
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+
+# import built-in module
+import array
+import json
+import struct
+import sys
+import typing
+
+# import third-party modules
+
+# import your own module
+from pons_dictionary.translation import Translation
+from pons_dictionary.translation_entry import TranslationEntry, _ParsedEntry
+
+# Serialized data layout (integers are little-endian):
+# - header: magic, version, number of fields of the parse result, then the array type code and the length of the
+#   string table, of the codes and of the references, and the size of the text of the strings
+# - string table: offset of the end of each string in the decoded text of the strings. The first strings are the names
+#   of the fields of the parse result, in the order of the values of the entries: values are read back by field name,
+#   so that data stays valid when fields are added to the parse result (e.g. by a new span rule).
+# - codes: the structure of the objects, as unsigned integers (see _Writer)
+# - references: the numbers in the string table of the strings of the objects, in order
+# - text of the strings: the strings of the string table, concatenated and UTF-8 encoded
+#
+# Each distinct string (API string, text, field value, ...) is stored once in the string table, and referred to by its
+# number wherever it appears.
+_MAGIC = b"PONSSER"
+_VERSION = 2
+_HEADER = struct.Struct("<7sBBcIcIcII")
+
+# Array type codes of unsigned integers, from the smallest: each array is stored with the smallest that fits its values
+_TYPECODES = "BHI"
+
+# Kinds of the serialized objects
+_ENTRY = 1
+_TRANSLATION = 2
+
+# Codes of opendict (None, False, True)
+_OPENDICT_CODES = {None: 0, False: 1, True: 2}
+_OPENDICT_STRS = {1: "false", 2: "true"}
+
+
+def _to_bytes(values: array.array) -> typing.Tuple[bytes, bytes]:
+    """
+    Returns the type code and the little-endian bytes of values, stored with the smallest type code that fits them.
+    """
+    largest = max(values, default=0)
+    typecode = next(typecode for typecode in _TYPECODES if largest < 1 << 8 * array.array(typecode).itemsize)
+    values = array.array(typecode, values)
+    if sys.byteorder == "big":  # pragma: no cover
+        values.byteswap()
+    return typecode.encode("ascii"), values.tobytes()
+
+
+def _from_bytes(typecode: bytes, data: bytes, offset: int, length: int) -> typing.Tuple[array.array, int]:
+    """
+    Returns the array of length values of typecode read at offset in data, and the offset following it.
+    """
+    if typecode not in (code.encode("ascii") for code in _TYPECODES):
+        raise ValueError("Corrupted pons_dictionary serialized data")
+    values = array.array(typecode.decode("ascii"))
+    end = offset + values.itemsize * length
+    values.frombytes(data[offset:end])
+    if sys.byteorder == "big":  # pragma: no cover
+        values.byteswap()
+    return values, end
+
+
+class _Writer:
+    """
+    Codes and string references of serialized objects, with their string table.
+
+    A translation is coded as its opendict, its translation object (if kept, as a tuple of keys and values, where values
+    that are not strings are JSON encoded in a tuple of one string) and its entries. An entry is coded as 0 if it is
+    None, else as 1 plus a mask of its values that are not None (its API string, then the fields of its parse result),
+    followed by these values. A value is coded as 0 if it is None, 1 if it is a string (the next reference),
+    or n + 2 if it is a tuple of n values, followed by these values.
+    """
+
+    def __init__(self):
+        # Initialize attributes
+        self.strings = dict.fromkeys(_ParsedEntry._fields)
+        for number, field in enumerate(self.strings):
+            self.strings[field] = number
+        self.codes = array.array("I")
+        self.references = array.array("I")
+
+    def add(self, value: typing.Union[str, tuple, None]) -> None:
+        if value is None:
+            self.codes.append(0)
+        elif isinstance(value, str):
+            number = self.strings.get(value)
+            if number is None:
+                number = self.strings[value] = len(self.strings)
+            self.codes.append(1)
+            self.references.append(number)
+        else:
+            self.codes.append(len(value) + 2)
+            for item in value:
+                self.add(item)
+
+    def add_entry(self, entry: typing.Optional[TranslationEntry]) -> None:
+        if entry is None:
+            self.codes.append(0)
+            return
+        values = (entry.raw, *entry._get_parsed())
+        mask = 0
+        for i, value in enumerate(values):
+            if value is not None:
+                mask |= 1 << i
+        self.codes.append(mask + 1)
+        for value in values:
+            if value is not None:
+                self.add(value)
+
+    def add_translation(self, translation: Translation) -> None:
+        raw = translation.raw
+        if raw is not None:
+            raw = tuple(item for key, value in raw.items()
+                        for item in (key, value if isinstance(value, str) else (json.dumps(value),)))
+        self.codes.append(_OPENDICT_CODES[translation.opendict])
+        self.add(raw)
+        self.add_entry(translation.source)
+        self.add_entry(translation.target)
+
+
+def dumps(objs: typing.Iterable[typing.Union[Translation, TranslationEntry]]) -> bytes:
+    """
+    Serializes Translation and TranslationEntry objects, with their parse result and their raw API strings and
+    translation objects (if kept), to a compact binary format read by loads.
+
+    Every distinct string is stored once, so that the API strings shared by a translation object and its entries, and
+    the field values shared by many entries (e.g. "feminine"), take no more room. Loading does not parse the API
+    strings again.
+    """
+    writer = _Writer()
+    for obj in objs:
+        if isinstance(obj, Translation):
+            writer.codes.append(_TRANSLATION)
+            writer.add_translation(obj)
+        elif isinstance(obj, TranslationEntry):
+            writer.codes.append(_ENTRY)
+            writer.add_entry(obj)
+        else:
+            raise TypeError(f"Expected Translation or TranslationEntry objects, got {type(obj).__name__}")
+
+    ends = array.array("I")
+    end = 0
+    for string in writer.strings:
+        end += len(string)
+        ends.append(end)
+    (ends_typecode, ends_bytes), (codes_typecode, codes_bytes), (references_typecode, references_bytes) = \
+        _to_bytes(ends), _to_bytes(writer.codes), _to_bytes(writer.references)
+    text = "".join(writer.strings).encode("utf-8")
+    header = _HEADER.pack(_MAGIC, _VERSION, len(_ParsedEntry._fields), ends_typecode, len(ends), codes_typecode,
+                          len(writer.codes), references_typecode, len(writer.references), len(text))
+    return b"".join([header, ends_bytes, codes_bytes, references_bytes, text])
+
+
+def loads(data: bytes) -> typing.List[typing.Union[Translation, TranslationEntry]]:
+    """
+    Returns the Translation and TranslationEntry objects serialized by dumps, in order. Raises ValueError if data was
+    not written by dumps, is truncated or corrupted, or was written by a version of pons_dictionary whose format is not
+    supported.
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError("Not pons_dictionary serialized data")
+    magic, version, field_count, ends_typecode, string_count, codes_typecode, code_count, references_typecode, \
+        reference_count, text_size = _HEADER.unpack_from(data, 0)
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError(f"Not pons_dictionary serialized data (version {_VERSION})")
+
+    ends, offset = _from_bytes(ends_typecode, data, _HEADER.size, string_count)
+    codes, offset = _from_bytes(codes_typecode, data, offset, code_count)
+    references, offset = _from_bytes(references_typecode, data, offset, reference_count)
+    if len(data) != offset + text_size or field_count > string_count:
+        raise ValueError("Truncated or corrupted pons_dictionary serialized data")
+    text = data[offset:].decode("utf-8")
+    strings = []
+    start = 0
+    for end in ends:
+        if end < start:
+            raise ValueError("Corrupted pons_dictionary serialized data")
+        strings.append(text[start:end])
+        start = end
+    if start != len(text):
+        raise ValueError("Corrupted pons_dictionary serialized data")
+
+    # Position of each stored value in the API string and parse result of an entry, None for fields that are no longer
+    # in the parse result. Fields missing from the data (added since it was written) are None.
+    field_positions = {field: i + 1 for i, field in enumerate(_ParsedEntry._fields)}
+    value_positions = [0] + [field_positions.get(field) for field in strings[:field_count]]
+    no_values = [None] * (1 + len(_ParsedEntry._fields))
+    # Positions of the values that are not None, by entry code
+    positions_by_code = {}
+    make_parsed = _ParsedEntry._make
+    from_parsed = TranslationEntry._from_parsed
+    from_entries = Translation._from_entries
+    codes = iter(codes)
+    next_code = codes.__next__
+    strings_read = map(strings.__getitem__, references)
+    next_string = strings_read.__next__
+
+    def read() -> typing.Union[str, tuple, None]:
+        code = next_code()
+        if code == 1:
+            return next_string()
+        if code == 0:
+            return None
+        return tuple([read() for _ in range(code - 2)])
+
+    def read_entry() -> typing.Optional[TranslationEntry]:
+        code = next_code()
+        if code == 0:
+            return None
+        positions = positions_by_code.get(code)
+        if positions is None:
+            if code - 1 >> 1 + field_count:
+                raise ValueError("Corrupted pons_dictionary serialized data")
+            positions = positions_by_code[code] = [value_positions[i] for i in range(1 + field_count)
+                                                   if (code - 1) & 1 << i]
+        values = no_values.copy()
+        for i in positions:
+            value = read()
+            if i is not None:
+                values[i] = value
+        return from_parsed(values[0], make_parsed(values[1:]))
+
+    objs = []
+    try:
+        for kind in codes:
+            if kind == _ENTRY:
+                objs.append(read_entry())
+            elif kind == _TRANSLATION:
+                opendict = next_code()
+                raw = read()
+                keep_raw = raw is not None
+                if keep_raw:
+                    obj = {key: json.loads(value[0]) if isinstance(value, tuple) else value
+                           for key, value in zip(raw[::2], raw[1::2])}
+                else:
+                    obj = {} if opendict == 0 else {"opendict": _OPENDICT_STRS[opendict]}
+                source = read_entry()
+                target = read_entry()
+                objs.append(from_entries(obj, source, target, keep_raw=keep_raw))
+            else:
+                raise ValueError("Corrupted pons_dictionary serialized data")
+        for _ in strings_read:
+            raise ValueError("Corrupted pons_dictionary serialized data")
+    except (StopIteration, IndexError, KeyError, TypeError):
+        raise ValueError("Truncated or corrupted pons_dictionary serialized data") from None
+    return objs
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 # import built-in module
+import concurrent.futures
 import re
 import typing
 import warnings
@@ -8,34 +9,72 @@ import warnings
 # import third-party modules
 
 # import your own module
+import pons_dictionary.translation_entry as pons_translation_entry
 from pons_dictionary.translation_entry import TranslationEntry
 
+# opendict is a string in translation objects, and a boolean in hits (translation hits are translation objects too)
+_OPENDICT_VALUES = {"true": True, "false": False, True: True, False: False}
+
+# Number of distinct API strings whose parse results parse_translations keeps for reuse. Strings recur within a response
+# (headwords, common targets), so recent strings are enough; keeping every string of a large batch only costs memory.
+_BATCH_PARSED_SIZE = 1024
+
 
 class Translation:
     """
     A Translation is comprised of a source (original expression) and a target (translated expression).
+
+    If lazy is True, the source and target entries are only parsed when their parsed properties are first accessed.
+    If keep_raw is False, neither the translation object nor the API strings of the entries are retained (raw is None).
+
+    Translations are read-only and slotted. Two translations are equal (and hash the same) if their opendict, source
+    and target are equal.
     """
 
-    def __init__(self, pons_translation_obj: dict):
+    __slots__ = ("_raw", "_opendict", "_source", "_target")
+
+    def __init__(self, pons_translation_obj: dict, lazy: bool = False, keep_raw: bool = True):
         # Initialize attributes
-        self._raw = pons_translation_obj
+        self._raw = pons_translation_obj if keep_raw else None
         self._opendict = None
         self._source = None
         self._target = None
 
         # Parsing pons_translation_obj
-        bool_map = {"true": True, "false": False}
         if "opendict" in pons_translation_obj:
-            self._opendict = bool_map[pons_translation_obj['opendict']]
+            self._opendict = _OPENDICT_VALUES[pons_translation_obj['opendict']]
 
         if "source" in pons_translation_obj:
-            self._source = TranslationEntry(pons_translation_obj['source'])
+            self._source = TranslationEntry(pons_translation_obj['source'], lazy=lazy, keep_raw=keep_raw)
 
         if "target" in pons_translation_obj:
-            self._target = TranslationEntry(pons_translation_obj['target'])
+            self._target = TranslationEntry(pons_translation_obj['target'], lazy=lazy, keep_raw=keep_raw)
+
+    @classmethod
+    def _from_entries(cls, pons_translation_obj: dict, source: typing.Optional[TranslationEntry],
+                      target: typing.Optional[TranslationEntry], keep_raw: bool = True) -> "Translation":
+        """
+        Creates a translation from already created source and target entries.
+        """
+        translation = cls.__new__(cls)
+        translation._raw = pons_translation_obj if keep_raw else None
+        translation._opendict = None
+        if "opendict" in pons_translation_obj:
+            translation._opendict = _OPENDICT_VALUES[pons_translation_obj['opendict']]
+        translation._source = source
+        translation._target = target
+        return translation
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Translation):
+            return NotImplemented
+        return (self._opendict, self._source, self._target) == (other._opendict, other._source, other._target)
+
+    def __hash__(self) -> int:
+        return hash((self._opendict, self._source, self._target))
 
     @property
-    def raw(self) -> dict:
+    def raw(self) -> typing.Optional[dict]:
         return self._raw
 
     @property
@@ -49,3 +88,90 @@ class Translation:
     @property
     def target(self) -> TranslationEntry:
         return self._target
+
+
+def parse_translations(pons_translation_objs: typing.Iterable[dict], keep_raw: bool = True) \
+        -> typing.List[Translation]:
+    """
+    Parses a batch of PONS translation objects, returning a list of Translation in the same order. See Translation for
+    keep_raw.
+
+    Equivalent to creating a Translation for each object, but an API string recurring among the recent strings of the
+    batch is parsed only once (headwords and common targets recur across the translations of a response). Batches
+    without recurring strings are parsed about as fast as in a loop. Unexpected patterns are collected (see
+    pons_dictionary.translation_entry.collect_diagnostics) and summarized in a single warning per batch.
+    """
+    parse = pons_translation_entry._parse
+    from_parsed = TranslationEntry._from_parsed
+    from_entries = Translation._from_entries
+    parsed_entries = {}
+
+    translations = []
+    with pons_translation_entry.collect_diagnostics():
+        for obj in pons_translation_objs:
+            entries = []
+            for key in ("source", "target"):
+                api_str = obj.get(key)
+                if api_str is None:
+                    entries.append(None)
+                    continue
+                parsed = parsed_entries.get(api_str)
+                if parsed is None:
+                    if len(parsed_entries) == _BATCH_PARSED_SIZE:
+                        parsed_entries.clear()
+                    parsed = parsed_entries[api_str] = parse(api_str)
+                entries.append(from_parsed(api_str if keep_raw else None, parsed))
+            translations.append(from_entries(obj, *entries, keep_raw=keep_raw))
+    return translations
+
+
+def _parse_api_strs(api_strs: typing.List[typing.Optional[str]]) \
+        -> typing.Tuple[typing.List[typing.Optional[tuple]], pons_translation_entry.ParseDiagnostics]:
+    """
+    Parses a chunk of API strings in a worker process. Results are returned as plain tuples (see _ParsedEntry), which
+    are cheaper to send back than entries, with the diagnostics of the chunk.
+    """
+    parse = pons_translation_entry._parse
+    parsed_entries = {}
+    results = []
+    with pons_translation_entry.collect_diagnostics(warn=False) as diagnostics:
+        for api_str in api_strs:
+            if api_str is None:
+                results.append(None)
+                continue
+            parsed = parsed_entries.get(api_str)
+            if parsed is None:
+                parsed = parsed_entries[api_str] = tuple(parse(api_str))
+            results.append(parsed)
+    return results, diagnostics
+
+
+def parse_translations_parallel(pons_translation_objs: typing.Iterable[dict], max_workers: typing.Optional[int] = None,
+                                chunk_size: int = 2000, keep_raw: bool = True) -> typing.List[Translation]:
+    """
+    Parses a batch of PONS translation objects in a pool of max_workers processes (default: number of CPUs), returning
+    a list of Translation in the same order. See Translation for keep_raw.
+
+    The objects are split into chunks of chunk_size; only their API strings are sent to the workers, which send back
+    the parse results and their diagnostics, summarized in a single warning as in parse_translations.
+    """
+    objs = list(pons_translation_objs)
+    api_strs = []
+    for obj in objs:
+        api_strs.append(obj.get("source"))
+        api_strs.append(obj.get("target"))
+    chunks = [api_strs[i:i + 2 * chunk_size] for i in range(0, len(api_strs), 2 * chunk_size)]
+
+    from_parsed = TranslationEntry._from_parsed
+    make_parsed = pons_translation_entry._ParsedEntry._make
+    entries = []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor, \
+            pons_translation_entry.collect_diagnostics() as diagnostics:
+        for chunk, (results, chunk_diagnostics) in zip(chunks, executor.map(_parse_api_strs, chunks)):
+            diagnostics._merge(chunk_diagnostics)
+            for api_str, parsed in zip(chunk, results):
+                entries.append(None if parsed is None else from_parsed(api_str if keep_raw else None,
+                                                                       make_parsed(parsed)))
+
+    return [Translation._from_entries(obj, entries[2 * i], entries[2 * i + 1], keep_raw=keep_raw)
+            for i, obj in enumerate(objs)]
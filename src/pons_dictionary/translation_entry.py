@@ -1,7 +1,11 @@
 # -*- coding: utf-8 -*-
 
 # import built-in module
+import contextlib
+import contextvars
+import functools
 import re
+import sys
 import typing
 import warnings
 
@@ -10,13 +14,555 @@ import warnings
 # import your own module
 
 
+# Opening or closing span/strong tag. Group 1 is opening tag name, group 2 is class, group 3 is closing tag name.
+_TAG_PATTERN = re.compile(r'<(span|strong) class="([^"]*)">|</(span|strong)>', re.UNICODE)
+
+# Text without tags followed by a single span without span or strong tags in it, e.g. a genus at the end of a target.
+# Group 1 is the text, group 2 is the class of the span, group 3 is its content.
+_TRAILING_SPAN_PATTERN = re.compile(r'([^<]+)<span class="([^"]*)">((?:[^<]|<(?!/?(?:span|strong)\b))*)</span>\Z',
+                                    re.UNICODE)
+
+# Group 1 is non-abbreviated, group 2 is abbreviated
+_ACRONYM_PATTERN = re.compile(r'<acronym title="(.*?)"(?:.*)?>(.*?)</acronym>', re.UNICODE)
+
+# Any acronym tag in a text. Group 1 is non-abbreviated, group 2 is abbreviated
+_ACRONYM_TAG_PATTERN = re.compile(r'<acronym title="([^"]*)"[^>]*>(.*?)</acronym>', re.UNICODE)
+
+
+class _SpanRule(typing.NamedTuple):
+    """
+    How a span class is parsed.
+
+    The span and its content are removed from the text. If field is set and the content is wrapped in opening and
+    closing, the unwrapped content (with acronyms expanded) is stored in field. If field is None, the span is ignored.
+    Values are interned if intern is True, which is only worth it for fields with a small vocabulary: interned strings
+    are never freed on some Python versions.
+    """
+    field: typing.Optional[str]
+    opening: str = ""
+    closing: str = ""
+    intern: bool = True
+
+
+# Span classes with a rule, mostly end-of-string parameters parsed into the field of the same name. Spans of other
+# classes are removed with a warning, unless they define the type of the entry. Adding a rule for a new field also
+# needs a property in TranslationEntry.
+_SPAN_RULES = {
+    "category": _SpanRule("category"),
+    "colloc": _SpanRule("colloc", "(", ")", intern=False),
+    "collocator": _SpanRule("collocator", intern=False),
+    "region": _SpanRule("region"),
+    "rhetoric": _SpanRule("rhetoric"),
+    "sense": _SpanRule("sense", "(", ")", intern=False),
+    "style": _SpanRule("style"),
+    "subject": _SpanRule("subject", "", ":", intern=False),
+    "topic": _SpanRule("topic"),
+    "grammar SUBST": _SpanRule(None),
+    "grammar VERB": _SpanRule(None),
+}
+
+# Version of the parsing rules, stored with persisted parse results (see pons_dictionary.cache and
+# pons_dictionary.local_dictionary) so that results of other rules are not used. Bump it whenever the parse result of an
+# API string changes.
+_PARSE_VERSION = 1
+
+# Fields of the parse result filled by span rules, in the order of the rules
+_FIELDS = tuple(dict.fromkeys(rule.field for rule in _SPAN_RULES.values() if rule.field is not None))
+
+# Types, span classes and most field values come from a small vocabulary ("feminine", "informal", "headword", ...).
+# They are interned so that all entries share a single string object per value. Free-form values (senses, hint
+# contents, ...) are not: on CPython 3.12, interned strings are never freed.
+_intern = sys.intern
+
+
+def _field_value(rule: _SpanRule, value: str) -> str:
+    return _intern(value) if rule.intern else value
+
+
+# Result of parsing an API string, from which TranslationEntry reads its properties: text, type, the fields of the
+# span rules, then the tokens of the text if it had hints. It is immutable so that it can be shared between entries:
+# fields with several values hold a tuple, which the properties of TranslationEntry return as a list.
+#
+# Hints are the spans removed from the text with their content (e.g. a genus). The tokens are the parts of the text
+# (strings, before stripping) and the hints ((span class, content) tuples) in order, so that the text with its hints is
+# rebuilt from them without parsing again. Entries without hints have no tokens (None).
+_ParsedEntry = typing.NamedTuple("_ParsedEntry", [("text", str), ("type", typing.Optional[str])] +
+                                 [(field, typing.Union[typing.Tuple[str, ...], str, None]) for field in _FIELDS] +
+                                 [("tokens", typing.Optional[typing.Tuple[typing.Union[str, typing.Tuple[str, str]],
+                                                                          ...]])])
+
+_NO_FIELD_VALUES = (None,) * len(_FIELDS)
+
+
+def _process_acronym(str_with_acronym: str, use_acronym: bool = False) -> str:
+    match = _ACRONYM_PATTERN.match(str_with_acronym)
+    if match is not None:
+        if use_acronym:
+            str_without_acronym = match.group(2)
+        else:
+            str_without_acronym = match.group(1)
+    else:
+        str_without_acronym = str_with_acronym
+    return str_without_acronym
+
+
+class ParseDiagnostics:
+    """
+    Unexpected spans found while parsing API strings in a collect_diagnostics block.
+
+    Properties:
+        counts: number of unexpected spans found, by span class
+        samples: first unexpected span found, by span class
+    """
+
+    def __init__(self):
+        # Initialize attributes
+        self._counts = {}
+        self._samples = {}
+
+    def __len__(self) -> int:
+        return sum(self._counts.values())
+
+    def _record(self, span_class: str, pattern: str, count: int = 1) -> None:
+        self._counts[span_class] = self._counts.get(span_class, 0) + count
+        self._samples.setdefault(span_class, pattern)
+
+    def _merge(self, other: "ParseDiagnostics") -> None:
+        for span_class, count in other._counts.items():
+            self._record(span_class, other._samples[span_class], count)
+
+    def summary(self) -> str:
+        """
+        Returns a one-line summary of the unexpected spans, by span class, most frequent first.
+        """
+        classes = sorted(self._counts, key=lambda span_class: (-self._counts[span_class], span_class))
+        return ", ".join(f"{span_class} ({self._counts[span_class]}, e.g. {self._samples[span_class]})"
+                         for span_class in classes)
+
+    @property
+    def counts(self) -> typing.Dict[str, int]:
+        return dict(self._counts)
+
+    @property
+    def samples(self) -> typing.Dict[str, str]:
+        return dict(self._samples)
+
+
+# Diagnostics of the innermost collect_diagnostics block, None outside of one
+_diagnostics = contextvars.ContextVar("pons_dictionary_diagnostics", default=None)
+
+
+@contextlib.contextmanager
+def collect_diagnostics(warn: bool = True) -> typing.Iterator[ParseDiagnostics]:
+    """
+    Context manager collecting the unexpected spans found while parsing in its block (in the current thread or asyncio
+    task), instead of emitting a warning for each of them. Yields the ParseDiagnostics.
+
+    On exit, if the block is nested in another collect_diagnostics block, the diagnostics are added to the outer ones.
+    Otherwise, if warn is True and unexpected spans were found, a single warning summarizes them.
+    """
+    diagnostics = ParseDiagnostics()
+    token = _diagnostics.set(diagnostics)
+    try:
+        yield diagnostics
+    finally:
+        _diagnostics.reset(token)
+    outer = _diagnostics.get()
+    if outer is not None:
+        outer._merge(diagnostics)
+    elif warn and diagnostics:
+        warnings.warn(f"Unexpected patterns found in API strs, removed from API strs: {diagnostics.summary()}.",
+                      UserWarning)
+
+
+def _report_unexpected(span_class: str, pattern: str) -> None:
+    """
+    Reports an unexpected span, removed from the text: to the current diagnostics, or else with a warning. The warning
+    names the class rather than the whole span, so that the warnings registry shows it once per class.
+    """
+    diagnostics = _diagnostics.get()
+    if diagnostics is not None:
+        diagnostics._record(span_class, pattern)
+    else:
+        warnings.warn(f"Unexpected pattern found in API str (<span class=\"{span_class}\">), removed from API str.",
+                      UserWarning)
+
+
+def _unwrap(rule: _SpanRule, content: str) -> typing.Optional[str]:
+    """
+    Removes the wrapping of the content of a field span. Returns None if the content is not wrapped as expected.
+    """
+    if not rule.opening and not rule.closing:
+        return content
+    if len(content) >= len(rule.opening) + len(rule.closing) and content.startswith(rule.opening) and \
+            content.endswith(rule.closing):
+        return content[len(rule.opening):len(content) - len(rule.closing)]
+    return None
+
+
+def _pair_tags(tags: typing.List[typing.Match]) -> typing.Dict[int, int]:
+    """
+    Pairs opening and closing tags. Returns a dict mapping the index of each opening tag to the index of its closing
+    tag. Tags without a partner are left out and treated as text.
+    """
+    closing = {}
+    open_tags = []
+    for i, tag in enumerate(tags):
+        if tag.group(1) is not None:
+            open_tags.append(i)
+        elif open_tags and tags[open_tags[-1]].group(1) == tag.group(3):
+            closing[open_tags.pop()] = i
+    return closing
+
+
+def _hint(span_class: str, content: str) -> typing.Tuple[str, str]:
+    """
+    Returns the token of a hint: its span class and its content without span and strong tags.
+    """
+    return _intern(span_class), _TAG_PATTERN.sub("", content).strip()
+
+
+def _hint_content(api_str: str, tags: typing.List[typing.Match], closing: typing.Dict[int, int], start: int,
+                  fields: typing.Dict[str, typing.List[str]]) -> str:
+    """
+    Returns the content of the hint span opened by tags[start], without its field spans, whose values are stored in
+    fields like those of the top-level spans. Other tags in it are left for _hint to strip.
+    """
+    end = closing[start]
+    parts = []
+    pos = tags[start].end()
+    i = start + 1
+    while i < end:
+        tag = tags[i]
+        if tag.group(1) == "span" and i in closing:
+            rule = _SPAN_RULES.get(tag.group(2))
+            if rule is not None and rule.field is not None:
+                value = _unwrap(rule, api_str[tag.end():tags[closing[i]].start()])
+                if value is not None:
+                    fields.setdefault(rule.field, []).append(_field_value(rule, value))
+                    parts.append(api_str[pos:tag.start()])
+                    i = closing[i] + 1
+                    pos = tags[i - 1].end()
+                    continue
+        i += 1
+    parts.append(api_str[pos:tags[end].start()])
+    return "".join(parts)
+
+
+def _text_and_tokens(parts: typing.List[typing.Union[str, typing.Tuple[str, str]]]) \
+        -> typing.Tuple[str, typing.Optional[tuple]]:
+    """
+    Returns the text of the parts of a text (strings and hints), and their tokens if there are hints.
+    """
+    if all(type(part) is str for part in parts):
+        return "".join(parts).strip(', '), None
+    tokens = []
+    start = 0
+    for i, part in enumerate(parts + [None]):
+        if type(part) is str:
+            continue
+        # Consecutive strings are joined into one token, empty ones are left out
+        text = "".join(parts[start:i])
+        if text:
+            tokens.append(text)
+        if part is not None:
+            tokens.append(part)
+        start = i + 1
+    return "".join(token for token in tokens if type(token) is str).strip(', '), tuple(tokens)
+
+
+def _text_with_hints(tokens: tuple) -> str:
+    """
+    Returns the text of tokens with their hints, in parentheses unless they already are.
+    """
+    parts = []
+    skipped = False  # Whether an empty hint was just left out, so that the spaces around it are not doubled
+    for token in tokens:
+        if type(token) is str:
+            if skipped and parts and parts[-1].endswith(" ") and token.startswith(" "):
+                token = token[1:]
+            parts.append(token)
+            skipped = False
+        elif token[1]:
+            content = token[1]
+            parts.append(content if content[0] == "(" and content[-1] == ")" else f"({content})")
+            skipped = False
+        else:
+            skipped = True
+    return "".join(parts).strip(', ')
+
+
+def _parse_api_str(api_str: str) -> _ParsedEntry:
+    """
+    Parses an API string. Strings without tags, and text followed by a single span (most targets), take a fast path
+    giving the same result as _parse_tags.
+    """
+    if "<" not in api_str:
+        return _ParsedEntry(api_str.strip(', '), None, *_NO_FIELD_VALUES, None)
+    match = None
+    if api_str[0] != "<" and api_str.endswith("</span>"):
+        match = _TRAILING_SPAN_PATTERN.match(api_str)
+    if match is None:
+        return _parse_tags(api_str)
+
+    text, span_class, content = match.groups()
+    rule = _SPAN_RULES.get(span_class)
+    if rule is not None and rule.field is not None:
+        value = _unwrap(rule, content)
+        if value is not None:
+            values = dict.fromkeys(_FIELDS)
+            values[rule.field] = _field_value(rule, value)
+            return _ParsedEntry(text=text.strip(', '), type=None, tokens=None, **values)
+    if rule is None or rule.field is not None:
+        _report_unexpected(span_class, api_str[match.end(1):])
+    return _ParsedEntry(text.strip(', '), None, *_NO_FIELD_VALUES, (text, _hint(span_class, content)))
+
+
+def _parse_tags(api_str: str) -> _ParsedEntry:
+    """
+    Parses an API string in a single pass over its tags.
+
+    - Field spans (see _SPAN_RULES) are removed from the text and their value is stored in the field.
+    - A span or headword strong at the start of the string defines the type. Its tags are removed but its content is
+      kept; anything following it is not part of the text.
+    - Tilde strong tags are removed, their content is kept.
+    - Any other span, including after the type-defining tags, is removed from the text with its content, which is kept
+      as a hint, with a warning if its class is unexpected. Field spans nested in it are parsed as above.
+    """
+    tags = list(_TAG_PATTERN.finditer(api_str))
+    closing = _pair_tags(tags)
+
+    fields = {}
+    entry_type = None
+    text_parts = []  # Strings and hints
+    has_text = False  # Whether non-empty text was kept so far
+    wrapper_closed = False  # Once the type-defining tags are closed, the rest is not part of the text
+    open_tags = []  # (index of closing tag, text to output on closing)
+    pos = 0
+    i = 0
+    while i < len(tags):
+        tag = tags[i]
+        if not wrapper_closed and tag.start() > pos:
+            text_parts.append(api_str[pos:tag.start()])
+            has_text = True
+        pos = tag.end()
+
+        if open_tags and open_tags[-1][0] == i:
+            # Closing a kept tag
+            _, closing_text = open_tags.pop()
+            if closing_text is None:
+                wrapper_closed = True
+            elif not wrapper_closed:
+                text_parts.append(closing_text)
+            i += 1
+            continue
+
+        if i not in closing:
+            # Unpaired tag is kept as text
+            if not wrapper_closed:
+                text_parts.append(tag.group(0))
+                has_text = True
+            i += 1
+            continue
+
+        tag_name, tag_class = tag.group(1), tag.group(2)
+        if tag_name == "span":
+            rule = _SPAN_RULES.get(tag_class)
+            if rule is not None and rule.field is not None:
+                value = _unwrap(rule, api_str[tag.end():tags[closing[i]].start()])
+                if value is not None:
+                    fields.setdefault(rule.field, []).append(_field_value(rule, value))
+                    i = closing[i] + 1
+                    pos = tags[i - 1].end()
+                    continue
+            if not has_text and not open_tags and entry_type is None and not wrapper_closed:
+                # Type-defining span
+                entry_type = _intern(tag_class)
+                open_tags.append((closing[i], None))
+                i += 1
+                continue
+            # Other span: strip with content, kept as a hint (also after the type-defining tags, separated from them)
+            closing_tag = tags[closing[i]]
+            pos = closing_tag.end()
+            if rule is None or rule.field is not None:
+                _report_unexpected(tag_class, api_str[tag.start():pos])
+            if wrapper_closed:
+                text_parts.append(" ")
+            text_parts.append(_hint(tag_class, _hint_content(api_str, tags, closing, i, fields)))
+            i = closing[i] + 1
+            continue
+
+        # strong
+        if tag_class == "headword" and not has_text and not wrapper_closed and \
+                all(closing_text is None for _, closing_text in open_tags):
+            # Type-defining headword
+            entry_type = "headword"
+            open_tags.append((closing[i], None))
+        elif tag_class == "tilde":
+            open_tags.append((closing[i], ""))
+        else:
+            if not wrapper_closed:
+                text_parts.append(tag.group(0))
+                has_text = True
+            open_tags.append((closing[i], tags[closing[i]].group(0)))
+        i += 1
+
+    if not wrapper_closed:
+        text_parts.append(api_str[pos:])
+
+    values = {}
+    for field in _FIELDS:
+        field_values = fields.get(field)
+        if field_values is None:
+            values[field] = None
+        elif len(field_values) == 1:
+            values[field] = field_values[0]
+        else:
+            values[field] = tuple(field_values)
+    text, tokens = _text_and_tokens(text_parts)
+    return _ParsedEntry(text=text, type=entry_type, tokens=tokens, **values)
+
+
+# Function used by TranslationEntry to parse API strings, replaced by a memoized version when the parse cache is enabled
+_parse = _parse_api_str
+
+
+def enable_parse_cache(maxsize: int = 4096) -> None:
+    """
+    Enables a cache of parse results, keyed on the API string, holding at most maxsize results (least recently used
+    results are evicted first). Entries created from an API string found in the cache share the cached, immutable
+    parse result instead of parsing it again.
+
+    Warnings about unexpected patterns are only emitted when a string is actually parsed, not on cache hits.
+    Enabling the cache again replaces the existing cache with an empty one.
+    """
+    global _parse
+    _parse = functools.lru_cache(maxsize=maxsize)(_parse_api_str)
+
+
+def disable_parse_cache() -> None:
+    """
+    Disables and empties the cache of parse results.
+    """
+    global _parse
+    _parse = _parse_api_str
+
+
+def parse_cache_info() -> typing.Optional[tuple]:
+    """
+    Returns the hits, misses, maxsize and currsize of the cache of parse results, or None if the cache is disabled.
+    """
+    if _parse is _parse_api_str:
+        return None
+    return _parse.cache_info()
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolve_acronym(value: str) -> typing.Tuple[str, str]:
+    """
+    Returns the expanded and abbreviated forms of a field value with acronyms. Forms are cached for all entries and
+    resolvers: most values with acronyms come from a small vocabulary, but free-form values (e.g. senses) are many, so
+    the least recently used forms are evicted. Only acronym titles and abbreviations are interned.
+    """
+    if _ACRONYM_PATTERN.match(value) is None:
+        return value, value
+    return _intern(_process_acronym(value)), _intern(_process_acronym(value, use_acronym=True))
+
+
+class AcronymResolver:
+    """
+    Chooses how the acronyms (<acronym title="informal">inf</acronym>) in the values of TranslationEntry are resolved:
+    "expand" to their title (informal), "abbreviate" to their abbreviation (inf), or for the text only "keep" the
+    acronym tags.
+
+    text is the choice for the text, fields the choice for all fields, overridden for single fields by keyword
+    (e.g. AcronymResolver(fields="expand", region="abbreviate")).
+
+    Parse results keep the acronyms: a resolver is applied when a property is read, so changing the resolver (see
+    set_acronym_resolver) does not parse entries again.
+    """
+
+    def __init__(self, text: str = "keep", fields: str = "expand", **field_choices: str):
+        if text not in ("keep", "expand", "abbreviate"):
+            raise ValueError(f"Unexpected choice for text: {text}")
+        for field, choice in dict(field_choices, fields=fields).items():
+            if field != "fields" and field not in _FIELDS:
+                raise ValueError(f"Unexpected field: {field}")
+            if choice not in ("expand", "abbreviate"):
+                raise ValueError(f"Unexpected choice for {field}: {choice}")
+        # Initialize attributes
+        self._text = text
+        # Index in the forms returned by _resolve_acronym, by field
+        self._forms = {field: 0 if field_choices.get(field, fields) == "expand" else 1 for field in _FIELDS}
+
+    def _resolve_text(self, text: str) -> str:
+        if self._text == "keep" or "<acronym" not in text:
+            return text
+        group = 1 if self._text == "expand" else 2
+        return _ACRONYM_TAG_PATTERN.sub(lambda match: match.group(group), text)
+
+    def resolve(self, entry: "TranslationEntry", field: str) -> typing.Union[typing.List[str], str, None]:
+        """
+        Returns the value of a field (or of text, text_with_hints, hints or type) of entry, with its acronyms resolved.
+        Fields with several values are returned as a list. Hints are resolved as the text.
+        """
+        parsed = entry._get_parsed()
+        if field == "text_with_hints":
+            return self._resolve_text(parsed.text if parsed.tokens is None else _text_with_hints(parsed.tokens))
+        if field == "hints":
+            if parsed.tokens is None:
+                return None
+            return [self._resolve_text(token[1]) for token in parsed.tokens if type(token) is tuple and token[1]] \
+                or None
+        value = getattr(parsed, field)
+        if value is None or field == "type":
+            return value
+        if field == "text":
+            return self._resolve_text(value)
+        form = self._forms[field]
+        if type(value) is tuple:
+            return [_resolve_acronym(v)[form] if "<" in v else v for v in value]
+        return _resolve_acronym(value)[form] if "<" in value else value
+
+
+# Resolver used by the properties of TranslationEntry
+_acronym_resolver = AcronymResolver()
+
+
+def set_acronym_resolver(resolver: typing.Optional[AcronymResolver]) -> None:
+    """
+    Sets the resolver used by the properties of all entries (None for the default: acronyms are expanded in fields and
+    kept in the text).
+    """
+    global _acronym_resolver
+    _acronym_resolver = resolver if resolver is not None else AcronymResolver()
+
+
+def get_acronym_resolver() -> AcronymResolver:
+    """
+    Returns the resolver used by the properties of all entries.
+    """
+    return _acronym_resolver
+
+
 class TranslationEntry:
     """
     Data related to a TranslationEntry, which is either the source or target of a translation.
 
+    If lazy is True, the API string is only parsed when one of the parsed properties is first accessed (warnings about
+    unexpected patterns are then also emitted on first access). The result is cached for subsequent accesses.
+
+    If keep_raw is False, the API string is parsed immediately and not retained (raw is None), so that long-lived
+    entries only hold their parsed values. It cannot be combined with lazy.
+
+    Entries are read-only and slotted to keep their memory footprint small. Two entries are equal (and hash the same)
+    if their parsed values are equal.
+
     Properties:
-        raw: raw string from API
+        raw: raw string from API (None if not kept)
         text: simple text of the translation entry
+        text_with_hints: text with its hints (e.g. a genus) in parentheses where they were
+        hints: contents of the spans removed from the text
         type: of the translations entry
         category:
         collocator:
@@ -31,157 +577,46 @@ class TranslationEntry:
 
     # NOTES:
     # - We have acronyms in <acronym title="value">abbreviation</acronym>
-    #   -- We keep the value
-    #   -- TODO: Offer possibility to keep acronym instead, in fields and text independently
+    #   -- We keep the value in fields and the acronym tags in the text, unless another AcronymResolver is set
     # - We have information that we want to read in tags span with the class indicating the category
     #   --  We want to delete the tags and their content from the final string
     # - We have the type-defining span / strong that is around the rich text string
     #   --  We want to save the type and delete the tags, but keep their contents.
     # - We have translation hints that are in tags span
-    #   --  We delete them completely or keep their content
-    #   -- TODO: Offer possibility to keep hints
-    #   --  If content is kept, and not surrounded by parenthesis, add parenthesis
+    #   --  We delete them from text, and keep their content in hints and text_with_hints
+    #   --  In text_with_hints, if content is not surrounded by parenthesis, add parenthesis
+
+    __slots__ = ("_raw", "_parsed")
+
+    def __init__(self, api_str: str, lazy: bool = False, keep_raw: bool = True):
+        if lazy and not keep_raw:
+            raise ValueError("A lazy TranslationEntry must keep its raw API string")
 
-    def __init__(self, api_str: str):
         # Initialize attributes
-        self._raw = api_str
-        self._text = None
-        self._type = None
-
-        self._category = None
-        self._colloc = None
-        self._collocator = None
-        self._region = None
-        self._rhetoric = None
-        self._sense = None
-        self._style = None
-        self._subject = None
-        self._topic = None
+        self._raw = api_str if keep_raw else None
+        self._parsed = None
 
         # PARSING of API string
-        # End-of-string parameters
-
-        # Parse category
-        category_pattern = re.compile(r'<span class="category">(.*?)</span>', re.UNICODE)  # Group 1 is category
-        self._category = self._parse_from_pattern(category_pattern, api_str)
-        api_str = self._strip_string_from_pattern(category_pattern, api_str)
-
-        # Parse colloc
-        colloc_pattern = re.compile(r'<span class="colloc">\((.*?)\)</span>', re.UNICODE)  # Group 1 is colloc
-        self._colloc = self._parse_from_pattern(colloc_pattern, api_str)
-        api_str = self._strip_string_from_pattern(colloc_pattern, api_str)
-
-        # Parse collocator
-        collocator_pattern = re.compile(r'<span class="collocator">(.*?)</span>', re.UNICODE)  # Group 1 is collocator
-        self._collocator = self._parse_from_pattern(collocator_pattern, api_str)
-        api_str = self._strip_string_from_pattern(collocator_pattern, api_str)
-
-        # Parse region
-        region_pattern = re.compile(r'<span class="region">(.*?)</span>', re.UNICODE)  # Group 1 is region
-        self._region = self._parse_from_pattern(region_pattern, api_str)
-        api_str = self._strip_string_from_pattern(region_pattern, api_str)
-
-        # Parse rhetoric
-        rhetoric_pattern = re.compile(r'<span class="rhetoric">(.*?)</span>', re.UNICODE)  # Group 1 is rhetoric
-        self._rhetoric = self._parse_from_pattern(rhetoric_pattern, api_str)
-        api_str = self._strip_string_from_pattern(rhetoric_pattern, api_str)
-
-        # Parse sense
-        sense_pattern = re.compile(r'<span class="sense">\((.*?)\)</span>', re.UNICODE)  # Group 1 is sense
-        self._sense = self._parse_from_pattern(sense_pattern, api_str)
-        api_str = self._strip_string_from_pattern(sense_pattern, api_str)
-
-        # Parse style
-        style_pattern = re.compile(r'<span class="style">(.*?)</span>', re.UNICODE)  # Group 1 is style
-        self._style = self._parse_from_pattern(style_pattern, api_str)
-        api_str = self._strip_string_from_pattern(style_pattern, api_str)
-
-        # Parse subject
-        subject_pattern = re.compile(r'<span class="subject">(.*?):</span>', re.UNICODE)  # Group 1 is subject
-        self._subject = self._parse_from_pattern(subject_pattern, api_str)
-        api_str = self._strip_string_from_pattern(subject_pattern, api_str)
-
-        # Parse topic
-        topic_pattern = re.compile(r'<span class="topic">(.*?)</span>', re.UNICODE)  # Group 1 is topic
-        self._topic = self._parse_from_pattern(topic_pattern, api_str)
-        api_str = self._strip_string_from_pattern(topic_pattern, api_str)
-
-        # In-string parameters
-        # Parse type (anything but headword)
-        type_pattern = re.compile(r'<span class="(.*?)">(.*)</span>',
-                                  re.UNICODE)  # Group 1 is type, Group 2 is rest of string
-        type_match = type_pattern.match(api_str)
-        if type_match is not None:
-            self._type = type_match.group(1)
-            api_str = type_match.group(2)
-
-        type_headword_pattern = re.compile(r'<strong class="(headword)">(.*)</strong>',
-                                           re.UNICODE)  # Group 1 is type, Group 2 is rest of string
-        type_headword_match = type_headword_pattern.match(api_str)
-        if type_headword_match is not None:
-            self._type = type_headword_match.group(1)
-            api_str = type_headword_match.group(2)
-
-        # Eliminate remaining tags
-        # <strong class="tilde">[A]</strong> -> strip tags, keep [A]
-        tilde_pattern = re.compile(r'<strong class="tilde">(.*?)</strong>', re.UNICODE)
-        for match in tilde_pattern.finditer(api_str):
-            api_str = api_str.replace(match.group(0), match.group(1))
-
-        # other tags: strip
-        span_classes_to_ignore = ["grammar SUBST", "grammar VERB"]
-        general_pattern = re.compile(r'<span class="(.*?)">(.*?)</span>', re.UNICODE)
-
-        for match in general_pattern.finditer(api_str):
-            if match.group(1) not in span_classes_to_ignore:
-                warnings.warn(f"Unexpected pattern found in API str ({match.group(0)}), removed from API str.",
-                              UserWarning)
-            api_str = api_str.replace(match.group(0), '')
-
-        self._text = api_str.strip(', ')
-
-    @staticmethod
-    def _process_acronym(str_with_acronym: str, use_acronym: bool = False):
-        pattern = re.compile(r'<acronym title="(.*?)"(?:.*)?>(.*?)</acronym>',
-                             re.UNICODE)  # Group 1 is non-abbreviated, group 2 is abbreviated
-        match = pattern.match(str_with_acronym)
-        if match is not None:
-            if use_acronym:
-                str_without_acronym = match.group(2)
-            else:
-                str_without_acronym = match.group(1)
-        else:
-            str_without_acronym = str_with_acronym
-        return str_without_acronym
+        if not lazy:
+            self._parsed = _parse(api_str)
 
-    def _parse_from_pattern(self, pattern: re.Pattern, string: str) -> typing.Union[typing.List[str], str]:
+    @classmethod
+    def _from_parsed(cls, api_str: typing.Optional[str], parsed: _ParsedEntry) -> "TranslationEntry":
         """
-        Looks in string for values contained in the group 1 of pattern.
-        If no values found, returns None;
-        If 1 value found, returns the value as a string;
-        If more than 1 values found, returns a list of values as strings.
+        Creates an entry from an API string that was already parsed. api_str is None if it is not kept.
         """
-        matches = pattern.finditer(string)
-        values = []
-        for m in matches:
-            values.append(self._process_acronym(m.group(1)))
-
-        if len(values) == 0:
-            return None
-        elif len(values) == 1:
-            return values[0]
-        else:
-            return values
+        entry = cls.__new__(cls)
+        entry._raw = api_str
+        entry._parsed = parsed
+        return entry
 
-    @staticmethod
-    def _strip_string_from_pattern(pattern: re.Pattern, string: str) -> str:
+    def _get_parsed(self) -> _ParsedEntry:
         """
-        Removes all matches of pattern in string.
+        Returns the parsed API string, parsing it first if the entry was created lazily.
         """
-        matches = pattern.finditer(string)
-        for m in matches:
-            string = string.replace(m.group(0), '')
-        return string
+        if self._parsed is None:
+            self._parsed = _parse(self._raw)
+        return self._parsed
 
     def __str__(self) -> str:
         if self.text is not None:
@@ -189,50 +624,66 @@ class TranslationEntry:
         else:
             return self.raw
 
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, TranslationEntry):
+            return NotImplemented
+        return self._get_parsed() == other._get_parsed()
+
+    def __hash__(self) -> int:
+        return hash(self._get_parsed())
+
     @property
     def raw(self):
         return self._raw
 
     @property
     def text(self):
-        return self._text
+        return _acronym_resolver.resolve(self, "text")
+
+    @property
+    def text_with_hints(self):
+        return _acronym_resolver.resolve(self, "text_with_hints")
+
+    @property
+    def hints(self):
+        return _acronym_resolver.resolve(self, "hints")
 
     @property
     def type(self):
-        return self._type
+        return self._get_parsed().type
 
     @property
     def category(self):
-        return self._category
+        return _acronym_resolver.resolve(self, "category")
 
     @property
     def colloc(self):
-        return self._colloc
+        return _acronym_resolver.resolve(self, "colloc")
 
     @property
     def collocator(self):
-        return self._collocator
+        return _acronym_resolver.resolve(self, "collocator")
 
     @property
     def region(self):
-        return self._region
+        return _acronym_resolver.resolve(self, "region")
 
     @property
     def rhetoric(self):
-        return self._rhetoric
+        return _acronym_resolver.resolve(self, "rhetoric")
 
     @property
     def sense(self):
-        return self._sense
+        return _acronym_resolver.resolve(self, "sense")
 
     @property
     def style(self):
-        return self._style
+        return _acronym_resolver.resolve(self, "style")
 
     @property
     def subject(self):
-        return self._subject
+        return _acronym_resolver.resolve(self, "subject")
 
     @property
     def topic(self):
-        return self._topic
+        return _acronym_resolver.resolve(self, "topic")
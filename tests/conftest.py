@@ -1,10 +1,220 @@
 """
-    Dummy conftest.py for pons_dictionary.
+    Fixtures shared by the tests of pons_dictionary.
 
-    If you don't know what this is for, just leave it empty.
     Read more about conftest.py under:
     - https://docs.pytest.org/en/stable/fixture.html
     - https://docs.pytest.org/en/stable/writing_plugins.html
 """
 
-# import pytest
+# import built-in module
+import gzip
+import http.server
+import json
+import threading
+import time
+import tracemalloc
+import typing
+import urllib.parse
+import warnings
+
+# import third-party modules
+import pytest
+
+# import your own module
+
+# 'ad', en > fr (shortened)
+AD_RESPONSE = [
+    {"lang": "en",
+     "hits": [
+         {"type": "entry",
+          "opendict": False,
+          "roms": [
+              {"headword": "ad",
+               "headword_full": "ad [æd] <span class=\"wordclass\">N</span>",
+               "wordclass": "noun",
+               "arabs": [
+                   {"header": "",
+                    "translations": [
+                        {"source": "<strong class=\"headword\">advertisement</strong>",
+                         "target": "publicité"},
+                        {"source": "<strong class=\"headword\">advertisement</strong> <span class=\"sense\">(in newspaper)</span>",
+                         "target": "annonce"},
+                    ]},
+               ]},
+          ]},
+     ]},
+]
+
+
+class StubPonsServer(http.server.ThreadingHTTPServer):
+    """
+    Local HTTP server standing in for the PONS Dictionary API.
+
+    responses maps a searched term to a list of (status, body) returned in turn (the last one is repeated); other terms
+    get a 204 response. Throttled responses (429, 503) have a Retry-After header if retry_after is set. requests records
+    the (path, query, headers) of the received requests, connections counts the TCP connections accepted. If release
+    is set to a threading.Event, responses are held until it is set; active is the number of requests being handled and
+    max_active the maximum number of requests handled at the same time.
+    """
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _StubPonsHandler)
+        self.responses = {}
+        self.requests = []
+        self.connections = 0
+        self.gzip = False
+        self.retry_after = None
+        self.release = None
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/v1/dictionary"
+
+    def process_request(self, request, client_address):
+        with self.lock:
+            self.connections += 1
+        super().process_request(request, client_address)
+
+
+class _StubPonsHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        url = urllib.parse.urlsplit(self.path)
+        query = dict(urllib.parse.parse_qsl(url.query))
+        with self.server.lock:
+            self.server.requests.append((url.path, query, dict(self.headers)))
+            responses = self.server.responses.get(query.get("q"), [(204, None)])
+            status, body = responses.pop(0) if len(responses) > 1 else responses[0]
+            self.server.active += 1
+            self.server.max_active = max(self.server.max_active, self.server.active)
+        if self.server.release is not None:
+            self.server.release.wait(10)
+        with self.server.lock:
+            self.server.active -= 1
+
+        data = b"" if body is None else json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        if status in (429, 503) and self.server.retry_after is not None:
+            self.send_header("Retry-After", str(self.server.retry_after))
+        if self.server.gzip and "gzip" in self.headers.get("Accept-Encoding", ""):
+            data = gzip.compress(data)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def ad_response():
+    return AD_RESPONSE
+
+
+@pytest.fixture
+def pons_server():
+    server = StubPonsServer()
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class BenchmarkResult(typing.NamedTuple):
+    """
+    Measures of a benchmark, per entry: throughput, memory blocks and bytes still allocated after the run (held by the
+    results), and peak of the memory allocated during the run.
+    """
+    entries_per_second: float
+    blocks_per_entry: float
+    bytes_per_entry: float
+    peak_bytes_per_entry: float
+
+
+# Slowdown and memory increase (relative to the baseline of --bench-compare) above which a benchmark fails
+BENCHMARK_TOLERANCE = 0.2
+
+_benchmark_results = {}
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmarks", "benchmarks (tests marked benchmark)")
+    group.addoption("--bench-save", metavar="PATH", help="write the results of the benchmarks to PATH (JSON)")
+    group.addoption("--bench-compare", metavar="PATH",
+                    help=f"fail the benchmarks slower or using more memory than in PATH (written by --bench-save) by "
+                         f"more than {BENCHMARK_TOLERANCE:.0%}")
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not _benchmark_results:
+        return
+    terminalreporter.section("benchmarks")
+    terminalreporter.write_line(f"{'':<40}{'entries/s':>12}{'blocks':>10}{'bytes':>10}{'peak bytes':>12}  (per entry)")
+    for name, result in _benchmark_results.items():
+        terminalreporter.write_line(f"{name:<40}{result.entries_per_second:>12,.0f}{result.blocks_per_entry:>10.1f}"
+                                    f"{result.bytes_per_entry:>10.0f}{result.peak_bytes_per_entry:>12.0f}")
+    path = config.getoption("--bench-save")
+    if path is not None:
+        with open(path, "w", encoding="utf-8") as fp:
+            json.dump({name: result._asdict() for name, result in _benchmark_results.items()}, fp, indent=2)
+
+
+@pytest.fixture
+def benchmark_run(request):
+    """
+    Returns a function running a benchmark: benchmark_run(name, function, count) calls function (which processes count
+    entries) for a number of rounds and returns its BenchmarkResult, the best throughput of the rounds and the memory
+    of a run traced with tracemalloc. Warnings are ignored.
+
+    The result is shown at the end of the session, and with --bench-compare, checked against a baseline saved with
+    --bench-save on the same machine and with the same options (coverage slows the benchmarks down), e.g.
+    pytest -m benchmark --no-cov --bench-save baseline.json, then pytest -m benchmark --no-cov --bench-compare
+    baseline.json after a change.
+    """
+    baseline_path = request.config.getoption("--bench-compare")
+    baseline = {}
+    if baseline_path is not None:
+        with open(baseline_path, encoding="utf-8") as fp:
+            baseline = json.load(fp)
+
+    def run(name: str, function: typing.Callable[[], typing.Any], count: int, rounds: int = 5) -> BenchmarkResult:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            best = float("inf")
+            for _ in range(rounds):
+                start = time.perf_counter()
+                function()
+                best = min(best, time.perf_counter() - start)
+
+            # Only the memory allocated by function is traced
+            tracemalloc.start()
+            try:
+                results = function()
+                size, peak = tracemalloc.get_traced_memory()
+                blocks = len(tracemalloc.take_snapshot().traces)
+            finally:
+                tracemalloc.stop()
+            del results
+
+        result = BenchmarkResult(count / best, blocks / count, size / count, peak / count)
+        _benchmark_results[name] = result
+        if name in baseline:
+            expected = BenchmarkResult(**baseline[name])
+            assert result.entries_per_second >= expected.entries_per_second * (1 - BENCHMARK_TOLERANCE), \
+                f"{name}: {result.entries_per_second:,.0f} entries/s, {expected.entries_per_second:,.0f} in baseline"
+            for field in ("blocks_per_entry", "bytes_per_entry", "peak_bytes_per_entry"):
+                assert getattr(result, field) <= getattr(expected, field) * (1 + BENCHMARK_TOLERANCE) + 1, \
+                    f"{name}: {field} {getattr(result, field):.1f}, {getattr(expected, field):.1f} in baseline"
+        return result
+
+    return run
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+# import built-in module
+
+# import third-party modules
+import pytest
+
+# import your own module
+import pons_dictionary
+from pons_dictionary.attribute_index import AttributeIndex
+from pons_dictionary.translation import Translation
+
+TRANSLATIONS = [
+    # 'go', en > fr
+    Translation({"source": '<strong class="headword">go</strong> <span class="style"><acronym title="informal">inf</acronym></span> <span class="region"><acronym title="British English" class="Brit">Brit</acronym></span>',
+                 "target": 'aller'}),
+    # 'big', en > fr
+    Translation({"source": '<span class="example">a <strong class="tilde">big</strong> eater</span> <span class="style"><acronym title="informal">inf</acronym></span>',
+                 "target": 'un gros mangeur'}),
+    # 'big', en > fr
+    Translation({"source": '<span class="example">to be <strong class="tilde">big</strong> on <acronym title="something">sth</acronym></span> <span class="region"><acronym title="American English" class="Am">Am</acronym></span>',
+                 "target": 'être fan de qc'}),
+    # 'unternehmen', de > fr
+    Translation({"source": 'gemischtwirtschaftliches <strong class="tilde">Unternehmen</strong> <span class="topic"><acronym title="commerce">COMM</acronym></span>, <span class="topic"><acronym title="law">LAW</acronym></span>',
+                 "target": 'entreprise d&#39;économie mixte'}),
+    # 'abbrechen', de > fr
+    Translation({"source": '<strong class="headword">abbrechen</strong> <span class="topic"><acronym title="computing">COMPUT</acronym></span> <span class="subject">Verbindung, Verarbeitung:</span>',
+                 "target": 'interrompre <span class="style"><acronym title="informal">inf</acronym></span>'}),
+]
+
+
+class TestAttributeIndex:
+    """
+    Tests for AttributeIndex.
+    """
+
+    def test_filter(self):
+        index = AttributeIndex(TRANSLATIONS)
+        assert len(index) == 5
+        assert index.filter(region="British English", style="informal") == [TRANSLATIONS[0]]
+        assert index.filter(style="informal") == [TRANSLATIONS[0], TRANSLATIONS[1], TRANSLATIONS[4]]
+        assert index.filter(topic="law") == [TRANSLATIONS[3]]
+        assert index.filter(topic="computing", subject="Verbindung, Verarbeitung") == [TRANSLATIONS[4]]
+        assert index.filter(region="Australian English") == []
+        assert index.filter(region="American English", style="informal") == []
+
+    def test_filter_any_value(self):
+        index = AttributeIndex(TRANSLATIONS)
+        assert index.filter(region=["British English", "American English"]) == [TRANSLATIONS[0], TRANSLATIONS[2]]
+        assert index.filter(topic=["law", "commerce"]) == [TRANSLATIONS[3]]
+        assert index.filter(topic=[]) == []
+
+    def test_positions(self):
+        index = AttributeIndex()
+        for translation in TRANSLATIONS * 3:
+            index.add(translation)
+        assert list(index.positions(style="informal", topic="computing")) == [4, 9, 14]
+        assert list(index.positions()) == list(range(15))
+        assert index[9] is TRANSLATIONS[4]
+
+    def test_values(self):
+        index = AttributeIndex(TRANSLATIONS)
+        assert index.values("style") == {"informal": 3}
+        assert index.values("topic") == {"commerce": 1, "law": 1, "computing": 1}
+        with pytest.raises(ValueError):
+            index.values("sense")
+        with pytest.raises(ValueError):
+            index.filter(sense="in newspaper")
+        assert pons_dictionary.AttributeIndex is AttributeIndex
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+# import built-in module
+import json
+import pathlib
+import re
+
+# import third-party modules
+import pytest
+
+# import your own module
+from pons_dictionary.reader import _walk_response
+from pons_dictionary.translation import Translation, parse_translations
+from pons_dictionary.translation_entry import _FIELDS, _SPAN_RULES, TranslationEntry, _parse_tags
+
+# Deselected by default (see setup.cfg), run with pytest -m benchmark
+pytestmark = pytest.mark.benchmark
+
+# Responses of the PONS API (shortened), with every span class handled by TranslationEntry
+CORPUS_PATH = pathlib.Path(__file__).with_name("corpus.json")
+
+# Number of times the corpus is parsed per round
+REPEAT = 50
+
+# Memory budgets per entry: blocks and bytes held by the results, and peak of the memory allocated while parsing
+BLOCKS_BUDGET = 6
+BYTES_BUDGET = 500
+PEAK_BYTES_BUDGET = 600
+
+
+@pytest.fixture(scope="module")
+def responses():
+    with open(CORPUS_PATH, encoding="utf-8") as fp:
+        return [[translation for _, translation in _walk_response(response)] for response in json.load(fp)]
+
+
+@pytest.fixture(scope="module")
+def api_strs(responses):
+    return [api_str for response in responses for translation in response for api_str in translation.values()
+            if isinstance(api_str, str)]
+
+
+def check_budgets(result):
+    assert result.blocks_per_entry <= BLOCKS_BUDGET
+    assert result.bytes_per_entry <= BYTES_BUDGET
+    assert result.peak_bytes_per_entry <= PEAK_BYTES_BUDGET
+
+
+class TestBenchmarks:
+    """
+    Benchmarks of the parsing of TranslationEntry and Translation objects over the recorded corpus. Results are shown
+    at the end of the session, see conftest.py for saving and comparing them.
+    """
+
+    def test_corpus(self, api_strs):
+        span_classes = set(re.findall(r'<(?:span|strong) class="([^"]+)"', " ".join(api_strs)))
+        assert span_classes >= set(_SPAN_RULES) | {"genus", "headword", "example", "idiom_proverb", "tilde"}
+        with pytest.warns(UserWarning):
+            entries = [TranslationEntry(api_str) for api_str in api_strs]
+        assert {field for field in _FIELDS for entry in entries if getattr(entry, field) is not None} == set(_FIELDS)
+        assert {entry.type for entry in entries} == {None, "headword", "example", "idiom_proverb"}
+
+    def test_parse_tags(self, benchmark_run, api_strs):
+        result = benchmark_run("_parse_tags", lambda: [_parse_tags(api_str) for api_str in api_strs * REPEAT],
+                               len(api_strs) * REPEAT)
+        check_budgets(result)
+
+    def test_translation_entry(self, benchmark_run, api_strs):
+        result = benchmark_run("TranslationEntry",
+                               lambda: [TranslationEntry(api_str) for api_str in api_strs * REPEAT],
+                               len(api_strs) * REPEAT)
+        check_budgets(result)
+
+    def test_translation(self, benchmark_run, responses, api_strs):
+        result = benchmark_run("Translation",
+                               lambda: [Translation(obj) for response in responses * REPEAT for obj in response],
+                               len(api_strs) * REPEAT)
+        check_budgets(result)
+
+    def test_parse_translations(self, benchmark_run, responses, api_strs):
+        result = benchmark_run("parse_translations (per response)",
+                               lambda: [parse_translations(response) for response in responses * REPEAT],
+                               len(api_strs) * REPEAT)
+        check_budgets(result)
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+# import built-in module
+import json
+import sqlite3
+
+# import third-party modules
+
+# import your own module
+from pons_dictionary.cache import ResponseCache, _entry_from_json
+from pons_dictionary.translation import Translation, parse_translations
+
+API_RAWS = [
+    # 'unternehmen', de > fr
+    {"opendict": "false",
+     "source": 'gemischtwirtschaftliches <strong class="tilde">Unternehmen</strong> <span class="grammar SUBST"><acronym title="neuter">nt</acronym></span> <span class="topic"><acronym title="commerce">COMM</acronym></span>, <span class="topic"><acronym title="law">LAW</acronym></span>',
+     "target": 'entreprise d&#39;économie mixte'},
+    # 'ad', en > fr
+    {"source": '<strong class="headword">advertisement</strong>'},
+]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestResponseCache:
+    """
+    Tests for ResponseCache.
+    """
+
+    def test_put_get(self, tmp_path):
+        with ResponseCache(str(tmp_path / "cache.sqlite")) as cache:
+            assert cache.get("q=unternehmen") is None
+            cache.put("q=unternehmen", 200, b"[]", parse_translations(API_RAWS))
+            status, body, translations = cache.get("q=unternehmen")
+            assert (cache.hits, cache.misses) == (1, 1)
+            assert len(cache) == 1
+
+        assert status == 200
+        assert body == b"[]"
+        assert translations == [Translation(api_raw) for api_raw in API_RAWS]
+        assert [t.raw for t in translations] == API_RAWS
+        assert translations[0].source.topic == ["commerce", "law"]
+        assert translations[0].source.hints == ['<acronym title="neuter">nt</acronym>']
+        assert translations[0].opendict is False
+        assert translations[1].target is None
+        assert hash(translations[0]) == hash(Translation(API_RAWS[0]))
+
+    def test_parsed_by_field_name(self):
+        # Fields added to the parse result after storing are None, fields removed since are ignored
+        entry = _entry_from_json("Werbung", {"text": "Werbung", "wordclass": "noun",
+                                             "tokens": ["Werbung ", ["genus", "f"]]})
+        assert entry.text == "Werbung"
+        assert entry.hints == ["f"]
+        assert entry.topic is None
+
+    def test_parsed_by_position_not_used(self, tmp_path):
+        # Parsed results stored by position (older versions) are parsed again
+        path = str(tmp_path / "cache.sqlite")
+        with ResponseCache(path) as cache:
+            cache.put("q=ad", 200, b"[]", parse_translations(API_RAWS[1:]))
+        connection = sqlite3.connect(path)
+        connection.execute("UPDATE responses SET parsed = ?",
+                           (json.dumps([[API_RAWS[1], ["advertisement", "headword"] + [None] * 10, None]]),))
+        connection.commit()
+        connection.close()
+        with ResponseCache(path) as cache:
+            assert cache.get("q=ad") == (200, b"[]", None)
+
+    def test_parsed_by_other_rules_not_used(self, tmp_path, monkeypatch):
+        # Parsed results stored with other parsing rules are parsed again
+        path = str(tmp_path / "cache.sqlite")
+        with ResponseCache(path) as cache:
+            cache.put("q=ad", 200, b"[]", parse_translations(API_RAWS[1:]))
+            monkeypatch.setattr("pons_dictionary.cache._PARSE_VERSION", -1)
+            assert cache.get("q=ad") == (200, b"[]", None)
+
+    def test_not_store_parsed(self, tmp_path):
+        with ResponseCache(str(tmp_path / "cache.sqlite"), store_parsed=False) as cache:
+            cache.put("q=unternehmen", 200, b"[]", parse_translations(API_RAWS))
+            assert cache.get("q=unternehmen") == (200, b"[]", None)
+
+    def test_ttl(self, tmp_path):
+        clock = FakeClock()
+        with ResponseCache(str(tmp_path / "cache.sqlite"), ttl=60, clock=clock) as cache:
+            cache.put("q=a", 204, b"", [])
+            clock.now += 30
+            cache.put("q=b", 204, b"", [])
+            clock.now += 31
+            assert cache.get("q=a") is None
+            assert cache.get("q=b") is not None
+            cache.put("q=c", 204, b"", [])
+            assert len(cache) == 2
+
+    def test_max_entries(self, tmp_path):
+        clock = FakeClock()
+        with ResponseCache(str(tmp_path / "cache.sqlite"), max_entries=2, clock=clock) as cache:
+            for key in ["q=a", "q=b"]:
+                cache.put(key, 204, b"", [])
+                clock.now += 1
+            cache.get("q=a")
+            clock.now += 1
+            cache.put("q=c", 204, b"", [])
+            assert len(cache) == 2
+            assert cache.get("q=b") is None
+            assert cache.get("q=a") is not None
+
+    def test_shared_file(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite")
+        with ResponseCache(path) as cache_1, ResponseCache(path) as cache_2:
+            cache_1.put("q=unternehmen", 200, b"[]", parse_translations(API_RAWS))
+            assert cache_2.get("q=unternehmen")[2][1].source.text == "advertisement"
+            cache_2.clear()
+            assert len(cache_1) == 0
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+# import built-in module
+
+# import third-party modules
+import pytest
+
+# import your own module
+from pons_dictionary.columnar import DictionaryColumn, to_arrow, to_columns, to_numpy, write_parquet
+from pons_dictionary.translation import Translation
+from pons_dictionary.translation_entry import TranslationEntry
+
+API_RAWS = [
+    # 'big', en > fr
+    {"opendict": "false",
+     "source": '<span class="example">a <strong class="tilde">big</strong> eater</span> <span class="style"><acronym title="informal">inf</acronym></span>',
+     "target": 'un gros mangeur'},
+    # 'unternehmen', de > fr
+    {"source": 'gemischtwirtschaftliches <strong class="tilde">Unternehmen</strong> <span class="grammar SUBST"><acronym title="neuter">nt</acronym></span> <span class="topic"><acronym title="commerce">COMM</acronym></span>, <span class="topic"><acronym title="law">LAW</acronym></span>',
+     "target": 'entreprise d&#39;économie mixte'},
+    # 'big', en > fr
+    {"source": '<span class="example">to be <strong class="tilde">big</strong> on <acronym title="something">sth</acronym></span> <span class="style"><acronym title="informal">inf</acronym></span>'},
+]
+
+
+class TestColumnar:
+    """
+    Tests for the columnar export.
+    """
+
+    def test_to_columns_translations(self):
+        columns = to_columns(Translation(api_raw) for api_raw in API_RAWS)
+        assert columns["opendict"] == [False, None, None]
+        assert columns["source_text"] == ["a big eater", "gemischtwirtschaftliches Unternehmen",
+                                          'to be big on <acronym title="something">sth</acronym>']
+        assert columns["target_text"] == ["un gros mangeur", "entreprise d&#39;économie mixte", None]
+        assert isinstance(columns["source_style"], DictionaryColumn)
+        assert list(columns["source_style"].codes) == [0, -1, 0]
+        assert columns["source_style"].values == ["informal"]
+        assert columns["source_type"].decode() == ["example", None, "example"]
+        assert columns["source_topic"].decode() == [None, "commerce; law", None]
+        assert columns["target_type"].decode() == [None, None, None]
+
+    def test_to_columns_entries(self):
+        columns = to_columns(Translation(api_raw).source for api_raw in API_RAWS)
+        assert columns["text"][0] == "a big eater"
+        assert columns["style"].decode() == ["informal", None, "informal"]
+
+    def test_to_columns_mixed(self):
+        with pytest.raises(TypeError):
+            to_columns([Translation(API_RAWS[0]), TranslationEntry(API_RAWS[0]["source"])])
+
+    def test_to_numpy(self):
+        numpy = pytest.importorskip("numpy")
+        records, values = to_numpy(Translation(api_raw) for api_raw in API_RAWS)
+        assert len(records) == 3
+        assert records["source_text"][1] == "gemischtwirtschaftliches Unternehmen"
+        assert values["source_style"] == ["informal"]
+        assert list(numpy.flatnonzero(records["source_style"] == values["source_style"].index("informal"))) == [0, 2]
+
+    def test_to_arrow_and_parquet(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        import pyarrow.parquet
+
+        table = to_arrow(Translation(api_raw) for api_raw in API_RAWS)
+        assert table.column("source_style").to_pylist() == ["informal", None, "informal"]
+        assert table.column("opendict").to_pylist() == [False, None, None]
+
+        path = str(tmp_path / "translations.parquet")
+        write_parquet([Translation(api_raw) for api_raw in API_RAWS], path)
+        assert pyarrow.parquet.read_table(path).column("source_text").to_pylist() == table.column(
+            "source_text").to_pylist()
@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+
+# import built-in module
+import asyncio
+import concurrent.futures
+import socket
+import threading
+import time
+
+# import third-party modules
+import pytest
+
+# import your own module
+import pons_dictionary
+from pons_dictionary.dictionary import AsyncPonsDictionary, PonsApiError, PonsDictionary, search
+from pons_dictionary.cache import ResponseCache
+from pons_dictionary.rate_limit import TokenBucket
+from pons_dictionary.translation import Translation
+
+
+def wait_until(condition, timeout: float = 10) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+class TestPonsDictionary:
+    """
+    Tests for PonsDictionary, against a local stub of the PONS API.
+    """
+
+    def test_search(self, pons_server, ad_response):
+        pons_server.responses["ad"] = [(200, ad_response)]
+        with PonsDictionary("en", "fr", "SECRET", base_url=pons_server.url) as dictionary:
+            translations = dictionary.search("ad")
+        assert translations == [Translation(t) for t in ad_response[0]["hits"][0]["roms"][0]["arabs"][0]["translations"]]
+        assert translations[1].source.sense == "in newspaper"
+
+        path, query, headers = pons_server.requests[0]
+        assert path == "/v1/dictionary"
+        assert query == {"q": "ad", "l": "enfr", "in": "en"}
+        assert headers["X-Secret"] == "SECRET"
+
+    def test_search_options(self, pons_server):
+        with PonsDictionary("fr", "de", "SECRET", base_url=pons_server.url) as dictionary:
+            assert dictionary.dictionary == "defr"
+            dictionary.search("aimer", fuzzy=True, references=True)
+        _, query, _ = pons_server.requests[0]
+        assert query == {"q": "aimer", "l": "defr", "in": "fr", "fm": "1", "ref": "true"}
+
+    def test_search_no_results(self, pons_server):
+        with PonsDictionary("en", "fr", "SECRET", base_url=pons_server.url) as dictionary:
+            assert dictionary.search("xyzzy") == []
+
+    def test_search_error(self, pons_server):
+        pons_server.responses["ad"] = [(403, None)]
+        with PonsDictionary("en", "fr", "WRONG SECRET", base_url=pons_server.url) as dictionary:
+            with pytest.raises(PonsApiError) as error:
+                dictionary.search("ad")
+        assert error.value.status == 403
+
+    def test_search_gzip(self, pons_server, ad_response):
+        pons_server.gzip = True
+        pons_server.responses["ad"] = [(200, ad_response)]
+        with PonsDictionary("en", "fr", "SECRET", base_url=pons_server.url) as dictionary:
+            assert len(dictionary.search("ad")) == 2
+        assert pons_server.requests[0][2]["Accept-Encoding"] == "gzip"
+
+    def test_connection_reused(self, pons_server, ad_response):
+        pons_server.responses["ad"] = [(200, ad_response)]
+        with PonsDictionary("en", "fr", "SECRET", base_url=pons_server.url) as dictionary:
+            for _ in range(5):
+                assert len(dictionary.search("ad")) == 2
+        assert len(pons_server.requests) == 5
+        assert pons_server.connections == 1
+
+    def test_closed_connection_retried(self, pons_server, ad_response):
+        pons_server.responses["ad"] = [(200, ad_response)]
+        with PonsDictionary("en", "fr", "SECRET", base_url=pons_server.url) as dictionary:
+            dictionary.search("ad")
+            # Server-side close of the idle keep-alive connection
+            connection, _ = dictionary._pool.get()
+            connection.sock.shutdown(socket.SHUT_RDWR)
+            dictionary._pool.put(connection)
+            assert len(dictionary.search("ad")) == 2
+        assert pons_server.connections == 2
+
+    def test_timeout(self):
+        listener = socket.socket()
+        listener.bind(("127.0.0.1", 0))
+        listener.listen(1)
+        try:
+            url = f"http://127.0.0.1:{listener.getsockname()[1]}/v1/dictionary"
+            with PonsDictionary("en", "fr", "SECRET", timeout=0.1, base_url=url) as dictionary:
+                with pytest.raises(socket.timeout):
+                    dictionary.search("ad")
+        finally:
+            listener.close()
+
+    def test_unsupported_scheme(self):
+        with pytest.raises(ValueError):
+            PonsDictionary("en", "fr", "SECRET", base_url="ftp://api.pons.com/v1/dictionary")
+
+    def test_throttled_request_retried(self, pons_server, ad_response):
+        pons_server.responses["ad"] = [(429, None), (503, None), (200, ad_response)]
+        with PonsDictionary("en", "fr", "SECRET", backoff_factor=0.01, base_url=pons_server.url) as dictionary:
+            assert len(dictionary.search("ad")) == 2
+            assert dictionary.stats == {"queued": 0, "in_flight": 0, "requests": 3, "throttled": 2, "retries": 2,
+                                        "deduplicated": 0}
+
+    def test_throttled_request_max_retries(self, pons_server):
+        pons_server.responses["ad"] = [(429, None)]
+        with PonsDictionary("en", "fr", "SECRET", max_retries=2, backoff_factor=0.01,
+                            base_url=pons_server.url) as dictionary:
+            with pytest.raises(PonsApiError) as error:
+                dictionary.search("ad")
+            assert dictionary.stats["requests"] == 3
+            assert dictionary.stats["retries"] == 2
+        assert error.value.status == 429
+
+    def test_rate_limiter(self, pons_server, ad_response):
+        pons_server.responses["ad"] = [(503, None), (200, ad_response)]
+        rate_limiter = TokenBucket(rate=1000, capacity=1)
+        with PonsDictionary("en", "fr", "SECRET", rate_limiter=rate_limiter, backoff_factor=0.01,
+                            base_url=pons_server.url) as dictionary:
+            assert len(dictionary.search("ad")) == 2
+            assert dictionary.search("xyzzy") == []
+            assert dictionary.stats == {"queued": 0, "in_flight": 0, "requests": 3, "throttled": 1, "retries": 1,
+                                        "deduplicated": 0}
+
+    def test_retry_delay(self):
+        dictionary = PonsDictionary("en", "fr", "SECRET", backoff_factor=0.5, max_backoff=3)
+        assert [dictionary._retry_delay(retry, None) for retry in range(4)] == [0.5, 1, 2, 3]
+        assert dictionary._retry_delay(0, "2") == 2
+        assert dictionary._retry_delay(0, "7") is None
+
+    def test_long_retry_after_not_retried(self, pons_server):
+        # e.g. daily quota exceeded
+        pons_server.responses["ad"] = [(503, None)]
+        pons_server.retry_after = 86400
+        with PonsDictionary("en", "fr", "SECRET", base_url=pons_server.url) as dictionary:
+            with pytest.raises(PonsApiError) as error:
+                dictionary.search("ad")
+            assert dictionary.stats["retries"] == 0
+        assert error.value.status == 503
+        assert len(pons_server.requests) == 1
+
+    @pytest.mark.parametrize("store_parsed", [True, False])
+    def test_cache(self, pons_server, ad_response, tmp_path, store_parsed):
+        pons_server.responses["ad"] = [(200, ad_response)]
+        with ResponseCache(str(tmp_path / "cache.sqlite"), store_parsed=store_parsed) as cache:
+            with PonsDictionary("en", "fr", "SECRET", cache=cache, base_url=pons_server.url) as dictionary:
+                translations = dictionary.search("ad")
+                assert dictionary.search("ad") == translations
+                assert dictionary.search("ad", fuzzy=True) == translations
+                assert dictionary.search("xyzzy") == []
+                assert dictionary.search("xyzzy") == []
+            with PonsDictionary("en", "de", "SECRET", cache=cache, base_url=pons_server.url) as dictionary:
+                assert dictionary.search("ad") == translations
+            assert (cache.hits, cache.misses) == (2, 4)
+        assert len(pons_server.requests) == 4
+
+    def test_cache_errors_not_stored(self, pons_server, tmp_path):
+        pons_server.responses["ad"] = [(403, None)]
+        with ResponseCache(str(tmp_path / "cache.sqlite")) as cache:
+            with PonsDictionary("en", "fr", "SECRET", cache=cache, base_url=pons_server.url) as dictionary:
+                with pytest.raises(PonsApiError):
+                    dictionary.search("ad")
+            assert len(cache) == 0
+
+    def test_concurrent_searches_coalesced(self, pons_server, ad_response):
+        pons_server.responses["ad"] = [(200, ad_response)]
+        # The response is held until the other searches are waiting for the first one
+        pons_server.release = threading.Event()
+        with PonsDictionary("en", "fr", "SECRET", base_url=pons_server.url) as dictionary:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
+                futures = [executor.submit(dictionary.search, "ad") for _ in range(5)]
+                wait_until(lambda: dictionary.stats["deduplicated"] == 4)
+                pons_server.release.set()
+                results = [future.result() for future in futures]
+            assert dictionary.stats["deduplicated"] == 4
+        assert len(pons_server.requests) == 1
+        assert all(translations == results[0] for translations in results)
+        assert results[0] is not results[1]
+
+    def test_concurrent_searches_coalesced_error(self, pons_server):
+        pons_server.responses["ad"] = [(403, None)]
+        pons_server.release = threading.Event()
+        with PonsDictionary("en", "fr", "SECRET", base_url=pons_server.url) as dictionary:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+                futures = [executor.submit(dictionary.search, "ad") for _ in range(3)]
+                wait_until(lambda: dictionary.stats["deduplicated"] == 2)
+                pons_server.release.set()
+            assert all(isinstance(future.exception(), PonsApiError) for future in futures)
+            assert dictionary.stats["deduplicated"] == 2
+        assert len(pons_server.requests) == 1
+
+    def test_search_function(self, pons_server, ad_response):
+        pons_server.responses["ad"] = [(200, ad_response)]
+        assert len(search("ad", "en", "fr", "SECRET", base_url=pons_server.url)) == 2
+        assert pons_dictionary.search is search
+        assert pons_dictionary.PonsDictionary is PonsDictionary
+
+
+class TestAsyncPonsDictionary:
+    """
+    Tests for AsyncPonsDictionary, against a local stub of the PONS API.
+    """
+
+    def test_search(self, pons_server, ad_response):
+        pons_server.responses["ad"] = [(200, ad_response)]
+
+        async def main():
+            async with AsyncPonsDictionary("en", "fr", "SECRET", base_url=pons_server.url) as dictionary:
+                return await dictionary.search("ad")
+
+        translations = asyncio.run(main())
+        assert translations == [Translation(t) for t in ad_response[0]["hits"][0]["roms"][0]["arabs"][0]["translations"]]
+
+    def test_search_many_bounded_concurrency(self, pons_server, ad_response):
+        terms = [f"ad{i}" for i in range(12)]
+        for term in terms[::2]:
+            pons_server.responses[term] = [(200, ad_response)]
+        # The responses are held until max_concurrency requests are handled at the same time
+        pons_server.release = threading.Event()
+
+        async def main():
+            async with AsyncPonsDictionary("en", "fr", "SECRET", max_concurrency=3,
+                                           base_url=pons_server.url) as dictionary:
+                task = asyncio.ensure_future(dictionary.search_many(terms))
+                while pons_server.active < 3:
+                    assert not task.done()
+                    await asyncio.sleep(0.001)
+                pons_server.release.set()
+                return await task
+
+        results = asyncio.run(main())
+        assert [len(translations) for translations in results] == [2, 0] * 6
+        assert pons_server.max_active == 3
+        assert pons_server.connections == 3
+
+    def test_concurrent_searches_coalesced(self, pons_server, ad_response):
+        pons_server.responses["ad"] = [(200, ad_response)]
+
+        async def main():
+            async with AsyncPonsDictionary("en", "fr", "SECRET", base_url=pons_server.url) as dictionary:
+                results = await dictionary.search_many(["ad"] * 5 + ["xyzzy"] * 2)
+                return results, dictionary.dictionary.stats
+
+        results, stats = asyncio.run(main())
+        assert [len(translations) for translations in results] == [2] * 5 + [0] * 2
+        assert stats["deduplicated"] == 5
+        assert len(pons_server.requests) == 2
+
+    def test_search_error(self, pons_server):
+        pons_server.responses["ad"] = [(403, None)]
+
+        async def main():
+            async with AsyncPonsDictionary("en", "fr", "SECRET", base_url=pons_server.url) as dictionary:
+                await dictionary.search("ad")
+
+        with pytest.raises(PonsApiError):
+            asyncio.run(main())
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+# import built-in module
+import json
+import random
+
+# import third-party modules
+import pytest
+
+# import your own module
+import pons_dictionary
+from pons_dictionary.local_dictionary import LocalDictionary, build_index, main
+from pons_dictionary.translation import Translation
+
+# 'ad' and 'aimer', with a headword hit without roms (shortened)
+AD_TRANSLATIONS = [
+    {"source": "<strong class=\"headword\">advertisement</strong>",
+     "target": "publicité"},
+    {"source": "<strong class=\"headword\">advertisement</strong> <span class=\"sense\">(in newspaper)</span>",
+     "target": "annonce"},
+]
+AIMER_TRANSLATIONS = [
+    {"source": "<strong class=\"headword\">aimer</strong>",
+     "target": "to love"},
+]
+AD_HIT = {"type": "entry", "opendict": False,
+          "roms": [{"headword": "ad", "arabs": [{"header": "", "translations": AD_TRANSLATIONS}]}]}
+ETE_HIT = {"type": "translation", "opendict": True,
+           "translations": [{"source": "<strong class=\"headword\">été</strong>", "target": "summer"},
+                            {"source": "<span class=\"example\">en été</span>", "target": "in summer"}]}
+AIMER_HIT = {"type": "translation", "opendict": False,
+             "source": "<strong class=\"headword\">aimer</strong>", "target": "to like"}
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    responses = tmp_path / "responses"
+    (responses / "fr").mkdir(parents=True)
+    (responses / "ad.json").write_text(json.dumps([{"lang": "en", "hits": [AD_HIT]}]), encoding="utf-8")
+    (responses / "fr" / "responses.jsonl").write_text(
+        json.dumps([{"lang": "fr", "hits": [{"type": "entry", "opendict": False, "roms": [
+            {"headword": "aimer", "arabs": [{"header": "", "translations": AIMER_TRANSLATIONS}]}]}]}]) + "\n" +
+        json.dumps([{"lang": "fr", "hits": [ETE_HIT, AD_HIT, AIMER_HIT]}]) + "\n", encoding="utf-8")
+    (responses / "notes.txt").write_text("not a response", encoding="utf-8")
+    path = str(tmp_path / "index.bin")
+    assert build_index(str(responses), path) == 3
+    return path
+
+
+class TestLocalDictionary:
+    """
+    Tests for build_index and LocalDictionary.
+    """
+
+    def test_search(self, index_path):
+        with LocalDictionary(index_path) as dictionary:
+            translations = dictionary.search("ad")
+            assert translations == [Translation(t) for t in AD_TRANSLATIONS]
+            assert translations[1].source.sense == "in newspaper"
+            assert translations[1].raw == AD_TRANSLATIONS[1]
+            assert dictionary.search("aimer") == [Translation(t) for t in [*AIMER_TRANSLATIONS, AIMER_HIT]]
+            assert dictionary.search("aimer")[1].opendict is False
+            assert dictionary.search("été") == [Translation(ETE_HIT["translations"][0])]
+            assert dictionary.search("xyzzy") == []
+            assert dictionary.search("a") == []
+            assert dictionary.search("zz") == []
+
+    def test_headwords(self, index_path):
+        with LocalDictionary(index_path) as dictionary:
+            assert len(dictionary) == 3
+            assert list(dictionary.headwords()) == ["ad", "aimer", "été"]
+            assert "aimer" in dictionary
+            assert "aime" not in dictionary
+
+    def test_search_prefix(self, index_path):
+        with LocalDictionary(index_path) as dictionary:
+            assert dictionary.search_prefix("a") == ["ad", "aimer"]
+            assert dictionary.search_prefix("a", limit=1) == ["ad"]
+            assert dictionary.search_prefix("ad") == ["ad"]
+            assert dictionary.search_prefix("ét") == ["été"]
+            assert dictionary.search_prefix("") == ["ad", "aimer", "été"]
+            assert dictionary.search_prefix("b") == []
+            assert dictionary.search_prefix("adv") == []
+
+    def test_search_fuzzy(self, index_path):
+        with LocalDictionary(index_path) as dictionary:
+            assert dictionary.search_fuzzy("ad") == ["ad"]
+            assert dictionary.search_fuzzy("aimr") == ["aimer"]
+            assert dictionary.search_fuzzy("ete") == []
+            assert dictionary.search_fuzzy("ete", max_distance=2) == ["été"]
+            assert dictionary.search_fuzzy("aide", max_distance=2) == ["ad", "aimer"]
+            assert dictionary.search_fuzzy("aide", max_distance=2, limit=1) == ["ad"]
+            assert dictionary.search_fuzzy("xyzzy") == []
+
+    def test_search_fuzzy_matches_edit_distance(self, tmp_path):
+        def distance(a, b):
+            previous = list(range(len(b) + 1))
+            for i, char in enumerate(a):
+                row = [i + 1] + [0] * len(b)
+                for j, other in enumerate(b):
+                    row[j + 1] = min(row[j] + 1, previous[j + 1] + 1, previous[j] + (char != other))
+                previous = row
+            return previous[-1]
+
+        rng = random.Random(0)
+        headwords = sorted({"".join(rng.choice("abc") for _ in range(rng.randint(1, 6))) for _ in range(300)})
+        hits = [{"type": "entry", "opendict": False, "roms": [
+            {"headword": headword, "arabs": [{"header": "", "translations": AIMER_TRANSLATIONS}]}]}
+            for headword in headwords]
+        (tmp_path / "responses.json").write_text(json.dumps([{"lang": "fr", "hits": hits}]), encoding="utf-8")
+        path = str(tmp_path / "index.bin")
+        build_index(str(tmp_path), path)
+        with LocalDictionary(path) as dictionary:
+            for term in ["", "a", "abc", "cab", "bbbb", "abcabc", "ccccccc"]:
+                for max_distance in range(3):
+                    expected = sorted((distance(term, headword), headword) for headword in headwords
+                                      if distance(term, headword) <= max_distance)
+                    assert dictionary.search_fuzzy(term, max_distance) == [headword for _, headword in expected]
+
+    def test_empty_index(self, tmp_path):
+        path = str(tmp_path / "index.bin")
+        assert build_index(str(tmp_path), path) == 0
+        with LocalDictionary(path) as dictionary:
+            assert len(dictionary) == 0
+            assert dictionary.search("ad") == []
+
+    def test_not_an_index(self, tmp_path):
+        path = tmp_path / "index.bin"
+        path.write_bytes(b"SQLite format 3\x00")
+        with pytest.raises(ValueError):
+            LocalDictionary(str(path))
+
+    def test_other_parsing_rules(self, index_path, monkeypatch):
+        monkeypatch.setattr("pons_dictionary.local_dictionary._PARSE_VERSION", -1)
+        with pytest.raises(ValueError, match="other parsing rules"):
+            LocalDictionary(index_path)
+
+    def test_main(self, tmp_path, capsys):
+        (tmp_path / "ad.json").write_text(json.dumps([{"lang": "en", "hits": [AD_HIT]}]), encoding="utf-8")
+        path = str(tmp_path / "index.bin")
+        main([str(tmp_path), path])
+        assert capsys.readouterr().out == f"Indexed 1 headwords in {path}\n"
+        with LocalDictionary(path) as dictionary:
+            assert len(dictionary.search("ad")) == 2
+        assert pons_dictionary.LocalDictionary is LocalDictionary
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+# import built-in module
+import threading
+
+# import third-party modules
+import pytest
+
+# import your own module
+from pons_dictionary.rate_limit import TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class TestTokenBucket:
+    """
+    Tests for TokenBucket, with a fake clock.
+    """
+
+    def test_burst_then_rate(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, capacity=3, clock=clock, sleep=clock.sleep)
+        assert [bucket.acquire() for _ in range(3)] == [0, 0, 0]
+        assert bucket.acquire() == pytest.approx(0.5)
+        assert bucket.acquire() == pytest.approx(0.5)
+        assert clock.now == pytest.approx(1.0)
+
+    def test_try_acquire(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, clock=clock, sleep=clock.sleep)
+        assert bucket.capacity == 1
+        assert bucket.try_acquire()
+        assert not bucket.try_acquire()
+        clock.now = 1.0
+        assert bucket.try_acquire()
+
+    def test_capacity_is_not_exceeded(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10, capacity=2, clock=clock, sleep=clock.sleep)
+        clock.now = 100.0
+        assert bucket.try_acquire()
+        assert bucket.try_acquire()
+        assert not bucket.try_acquire()
+
+    def test_pause(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, capacity=5, clock=clock, sleep=clock.sleep)
+        bucket.pause(10)
+        assert not bucket.try_acquire()
+        assert bucket.acquire() == pytest.approx(11)
+        assert clock.now == pytest.approx(11)
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+    def test_acquire_more_than_capacity(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, capacity=2, clock=clock, sleep=clock.sleep)
+        with pytest.raises(ValueError):
+            bucket.acquire(3)
+        assert bucket.acquire(2) == 0
+
+    def test_shared_by_threads(self):
+        bucket = TokenBucket(rate=1000, capacity=10)
+        acquired = []
+
+        def worker():
+            for _ in range(10):
+                bucket.acquire()
+                acquired.append(1)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(acquired) == 40
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+# import built-in module
+import io
+import json
+
+# import third-party modules
+import pytest
+
+# import your own module
+from pons_dictionary.reader import _iter_json_values, iter_translations, read_translations
+from pons_dictionary.translation import Translation
+
+# 'ad', en > fr (shortened)
+RESPONSE = [
+    {"lang": "en",
+     "hits": [
+         {"type": "entry",
+          "opendict": False,
+          "roms": [
+              {"headword": "ad",
+               "headword_full": "ad [æd] <span class=\"wordclass\">N</span>",
+               "wordclass": "noun",
+               "arabs": [
+                   {"header": "",
+                    "translations": [
+                        {"source": "<strong class=\"headword\">advertisement</strong>",
+                         "target": "publicité <span class=\"genus\"><acronym title=\"feminine\">f</acronym></span>"},
+                        {"source": "<strong class=\"headword\">advertisement</strong> <span class=\"sense\">(in newspaper)</span>",
+                         "target": "annonce <span class=\"genus\"><acronym title=\"feminine\">f</acronym></span>"},
+                    ]},
+               ]},
+          ]},
+         {"type": "translation",
+          "opendict": False,
+          "translations": [
+              {"source": "<strong class=\"headword\">ad</strong>",
+               "target": "pub"},
+          ]},
+         {"type": "translation",
+          "opendict": True,
+          "source": "<strong class=\"headword\">ad</strong>",
+          "target": "réclame"},
+     ]},
+]
+
+
+class TestReader:
+    """
+    Tests for the streaming reader.
+    """
+
+    def test_iter_json_values_array(self):
+        fp = io.StringIO(' [ {"a": [1, 2]} , {"b": "]"}, [3] ] ')
+        assert list(_iter_json_values(fp, chunk_size=3)) == [{"a": [1, 2]}, {"b": "]"}, [3]]
+
+    def test_iter_json_values_json_lines(self):
+        fp = io.StringIO('[{"a": 1}, {"b": 2}]\n{"c": 3}\n[]\n[{"d": 4}]\n')
+        assert list(_iter_json_values(fp, chunk_size=4)) == [{"a": 1}, {"b": 2}, {"c": 3}, {"d": 4}]
+
+    def test_iter_json_values_chunk_boundaries(self):
+        text = '1.5 [1.5, -2e-3, true] 5.5e3\n{"a": [10, null]} [] 42'
+        expected = [1.5, 1.5, -2e-3, True, 5.5e3, {"a": [10, None]}, 42]
+        for chunk_size in range(1, 9):
+            assert list(_iter_json_values(io.StringIO(text), chunk_size=chunk_size)) == expected
+
+    def test_iter_json_values_invalid(self):
+        with pytest.raises(ValueError):
+            list(_iter_json_values(io.StringIO('[{"a": 1} {"b": 2}]'), chunk_size=4))
+        with pytest.raises(ValueError):
+            list(_iter_json_values(io.StringIO('[{"a": 1}, {"b": '), chunk_size=4))
+
+    def test_iter_translations(self):
+        with pytest.warns(UserWarning):
+            translations = list(iter_translations(io.StringIO(json.dumps(RESPONSE))))
+        assert translations == [Translation(t) for t in [*RESPONSE[0]["hits"][0]["roms"][0]["arabs"][0]["translations"],
+                                                         *RESPONSE[0]["hits"][1]["translations"],
+                                                         RESPONSE[0]["hits"][2]]]
+        assert translations[1].source.sense == "in newspaper"
+        assert translations[2].target.text == "pub"
+        assert translations[3].target.text == "réclame"
+        assert translations[3].opendict is True
+
+    def test_iter_translations_json_lines(self):
+        fp = io.StringIO(json.dumps(RESPONSE) + "\n" + json.dumps(RESPONSE) + "\n")
+        translations = list(iter_translations(fp, lazy=True))
+        assert len(translations) == 8
+        assert translations[4] == translations[0]
+
+    def test_iter_translations_is_incremental(self):
+        fp = io.StringIO(json.dumps(RESPONSE) + "\n" + "not json")
+        translations = iter_translations(fp, lazy=True)
+        assert next(translations).source.text == "advertisement"
+
+    def test_read_translations(self, tmp_path):
+        path = tmp_path / "response.json"
+        path.write_text(json.dumps([RESPONSE, RESPONSE]), encoding="utf-8")
+        assert len(list(read_translations(str(path), lazy=True))) == 8
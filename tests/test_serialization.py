@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+# import built-in module
+import pickle
+import typing
+
+# import third-party modules
+import pytest
+
+# import your own module
+import pons_dictionary.serialization as pons_serialization
+from pons_dictionary.serialization import dumps, loads
+from pons_dictionary.translation import Translation, parse_translations
+from pons_dictionary.translation_entry import TranslationEntry, _ParsedEntry
+
+API_RAWS = [
+    # 'unternehmen', de > fr
+    {"opendict": "false",
+     "source": 'gemischtwirtschaftliches <strong class="tilde">Unternehmen</strong> <span class="grammar SUBST"><acronym title="neuter">nt</acronym></span> <span class="topic"><acronym title="commerce">COMM</acronym></span>, <span class="topic"><acronym title="law">LAW</acronym></span>',
+     "target": 'entreprise <span class="genus"><acronym title="feminine">f</acronym></span> d&#39;économie mixte'},
+    # 'big', en > fr
+    {"opendict": "true",
+     "source": '<span class="example">a <strong class="tilde">big</strong> eater</span> <span class="style"><acronym title="informal">inf</acronym></span>',
+     "target": 'un gros mangeur'},
+    # 'ad', en > fr
+    {"source": '<strong class="headword">advertisement</strong>'},
+]
+
+
+class TestSerialization:
+    """
+    Tests for dumps and loads.
+    """
+
+    @pytest.mark.parametrize("keep_raw", [True, False])
+    def test_translations(self, keep_raw):
+        with pytest.warns(UserWarning):
+            translations = parse_translations(API_RAWS, keep_raw=keep_raw)
+        loaded = loads(dumps(translations))
+        assert loaded == translations
+        for translation, loaded_translation in zip(translations, loaded):
+            assert loaded_translation.raw == translation.raw
+            assert loaded_translation.opendict == translation.opendict
+            assert loaded_translation.source.raw == translation.source.raw
+        assert loaded[0].source.topic == ["commerce", "law"]
+        assert loaded[0].target.text_with_hints == \
+            'entreprise (<acronym title="feminine">f</acronym>) d&#39;économie mixte'
+        assert loaded[2].target is None
+
+    def test_entries(self):
+        entries = [TranslationEntry("publicité"), TranslationEntry(API_RAWS[1]["source"], lazy=True),
+                   TranslationEntry(API_RAWS[2]["source"], keep_raw=False)]
+        objs = entries + [Translation(API_RAWS[1])]
+        loaded = loads(dumps(objs))
+        assert loaded == objs
+        assert [entry.raw for entry in loaded[:3]] == ["publicité", API_RAWS[1]["source"], None]
+        assert loaded[1].style == "informal"
+        assert loads(dumps([])) == []
+
+    def test_strings_stored_once(self):
+        translations = [Translation(API_RAWS[1]) for _ in range(100)]
+        data = dumps(translations)
+        assert data.count(API_RAWS[1]["source"].encode("utf-8")) == 1
+        assert len(data) < len(pickle.dumps(translations)) / 2
+
+    def test_invalid(self):
+        with pytest.raises(TypeError):
+            dumps([API_RAWS[0]])
+        with pytest.raises(ValueError):
+            loads(b"")
+        with pytest.raises(ValueError):
+            loads(pickle.dumps([Translation(API_RAWS[2])]))
+
+    def test_translation_hit(self):
+        # Translation hits have non-string values
+        hit = {"type": "translation", "opendict": False, "source": API_RAWS[2]["source"], "target": "publicité"}
+        translation, = loads(dumps([Translation(hit)]))
+        assert translation.raw == hit
+        assert translation.opendict is False
+
+    def test_fields_read_by_name(self, monkeypatch):
+        # 'ad', en > de
+        with pytest.warns(UserWarning):
+            entry = TranslationEntry('Werbung <span class="genus"><acronym title="feminine">f</acronym></span>',
+                                     keep_raw=False)
+        data = dumps([entry])
+        # A field added to the parse result (e.g. by a new span rule) before the tokens
+        fields = [(field, typing.Any) for field in _ParsedEntry._fields]
+        monkeypatch.setattr(pons_serialization, "_ParsedEntry",
+                            typing.NamedTuple("_ParsedEntry", fields[:-1] + [("wordclass", typing.Any)] + fields[-1:]))
+        loaded, = loads(data)
+        assert loaded._parsed.wordclass is None
+        assert loaded._parsed.tokens == entry._parsed.tokens
+        assert loaded._parsed.text == "Werbung"
+
+    def test_truncated(self):
+        data = dumps(parse_translations(API_RAWS[1:]))
+        for size in range(len(data)):
+            with pytest.raises(ValueError):
+                loads(data[:size])
+        with pytest.raises(ValueError):
+            loads(data + b"\x00")
@@ -1,13 +1,16 @@
 # -*- coding: utf-8 -*-
 
 # import built-in module
+import warnings
 
 # import third-party modules
 import pytest
 
 # import your own module
 import pons_dictionary.translation
-from pons_dictionary.translation import Translation
+import pons_dictionary.translation_entry
+from pons_dictionary.translation import Translation, parse_translations, parse_translations_parallel
+from pons_dictionary.translation_entry import collect_diagnostics
 
 
 class TestTranslation:
@@ -57,7 +60,7 @@ class TestTranslation:
                    }
         t = Translation(api_raw)
 
-        spy.assert_any_call(t.source, api_raw['source'])
+        spy.assert_any_call(t.source, api_raw['source'], lazy=False, keep_raw=True)
         assert isinstance(t.source, pons_dictionary.translation.TranslationEntry)
 
     def test_target(self, mocker):
@@ -68,5 +71,150 @@ class TestTranslation:
                    }
         t = Translation(api_raw)
 
-        spy.assert_any_call(t.target, api_raw['target'])
+        spy.assert_any_call(t.target, api_raw['target'], lazy=False, keep_raw=True)
         assert isinstance(t.target, pons_dictionary.translation.TranslationEntry)
+
+    def test_lazy(self, mocker):
+        spy = mocker.spy(pons_dictionary.translation.TranslationEntry, "__init__")
+        # 'ad', en > fr
+        api_raw = {"source": "<strong class=\"headword\">advertisement</strong>",
+                   "target": "publicit\u00e9 <span class=\"genus\"><acronym title=\"feminine\">f</acronym></span>"
+                   }
+        t = Translation(api_raw, lazy=True)
+
+        spy.assert_any_call(t.source, api_raw['source'], lazy=True, keep_raw=True)
+        spy.assert_any_call(t.target, api_raw['target'], lazy=True, keep_raw=True)
+
+    def test_keep_raw_false(self):
+        # 'ad', en > fr
+        api_raw = {"source": "<strong class=\"headword\">advertisement</strong>",
+                   "target": "publicit\u00e9"}
+        t = Translation(api_raw, keep_raw=False)
+        assert t.raw is None
+        assert t.source.raw is None
+        assert t.source.text == "advertisement"
+        assert t == Translation(api_raw)
+
+    def test_eq_and_hash(self):
+        # 'ad', en > fr
+        api_raw = {"source": "<strong class=\"headword\">advertisement</strong>",
+                   "target": "publicit\u00e9 <span class=\"genus\"><acronym title=\"feminine\">f</acronym></span>"
+                   }
+        t_1 = Translation(api_raw)
+        t_2 = Translation(dict(api_raw), lazy=True)
+        t_3 = Translation(dict(api_raw, opendict="true"))
+        assert t_1 == t_2
+        assert hash(t_1) == hash(t_2)
+        assert t_1 != t_3
+        assert len({t_1, t_2, t_3}) == 2
+
+    def test_read_only(self):
+        # 'ad', en > fr
+        t = Translation({"source": "<strong class=\"headword\">advertisement</strong>"})
+        with pytest.raises(AttributeError):
+            t.source = None
+        with pytest.raises(AttributeError):
+            t.new_attribute = 'value'
+
+
+class TestParseTranslations:
+    """
+    Tests for parse_translations.
+    """
+
+    def test_same_as_translation(self):
+        # 'ad', en > fr and en > de
+        api_raws = [{"opendict": "false",
+                     "source": "<strong class=\"headword\">advertisement</strong>",
+                     "target": "publicit\u00e9 <span class=\"genus\"><acronym title=\"feminine\">f</acronym></span>"},
+                    {"source": "<strong class=\"headword\">advertisement</strong>",
+                     "target": "Werbung <span class=\"genus\"><acronym title=\"feminine\">f</acronym></span>"},
+                    {"source": "<strong class=\"headword\">advertisement</strong>"}]
+        with pytest.warns(UserWarning):
+            translations = parse_translations(iter(api_raws))
+        assert translations == [Translation(api_raw) for api_raw in api_raws]
+        assert [t.raw for t in translations] == api_raws
+        assert translations[0].opendict is False
+        assert translations[2].target is None
+
+    def test_single_warning(self):
+        # 'ad', en > fr and en > de
+        api_raws = [{"target": "publicit\u00e9 <span class=\"genus\"><acronym title=\"feminine\">f</acronym></span>"},
+                    {"target": "Werbung <span class=\"genus\"><acronym title=\"feminine\">f</acronym></span>"},
+                    {"target": "<span class=\"example\">a <strong class=\"tilde\">big</strong> ad</span> <span class=\"genus\">m</span>"}]
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            parse_translations(api_raws)
+        assert [str(w.message) for w in caught] == [
+            "Unexpected patterns found in API strs, removed from API strs: "
+            "genus (3, e.g. <span class=\"genus\"><acronym title=\"feminine\">f</acronym></span>)."]
+
+        with collect_diagnostics(warn=False) as diagnostics:
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                parse_translations(api_raws * 2)
+        assert diagnostics.counts == {"genus": 3}
+
+    def test_keep_raw_false(self):
+        # 'ad', en > fr
+        api_raw = {"source": "<strong class=\"headword\">advertisement</strong>",
+                   "target": "publicit\u00e9"}
+        translations = parse_translations([api_raw], keep_raw=False)
+        assert translations[0].raw is None
+        assert translations[0].target.raw is None
+        assert translations == [Translation(api_raw)]
+
+    def test_parses_each_string_once(self, mocker):
+        spy = mocker.spy(pons_dictionary.translation_entry, "_parse")
+        # 'ad', en > fr
+        api_raw = {"source": "<strong class=\"headword\">advertisement</strong>",
+                   "target": "publicit\u00e9"}
+        translations = parse_translations([api_raw, dict(api_raw), dict(api_raw)])
+        assert spy.call_count == 2
+        assert translations[0].source.text == "advertisement"
+        assert translations[2].target.text == "publicit\u00e9"
+
+    def test_parsed_strings_bounded(self, mocker, monkeypatch):
+        monkeypatch.setattr(pons_dictionary.translation, "_BATCH_PARSED_SIZE", 3)
+        spy = mocker.spy(pons_dictionary.translation_entry, "_parse")
+        api_raws = [{"source": f"word {i}", "target": "mot"} for i in range(3)]
+        translations = parse_translations(api_raws)
+        # Parse results of older strings are dropped once the limit is reached
+        assert spy.call_count == 5
+        assert translations == [Translation(api_raw) for api_raw in api_raws]
+
+
+class TestParseTranslationsParallel:
+    """
+    Tests for parse_translations_parallel.
+    """
+
+    def test_same_as_translation(self):
+        # 'ad', en > fr and en > de
+        api_raws = [{"opendict": "false",
+                     "source": "<strong class=\"headword\">advertisement</strong>",
+                     "target": "publicit\u00e9 <span class=\"genus\"><acronym title=\"feminine\">f</acronym></span>"},
+                    {"source": "<strong class=\"headword\">advertisement</strong> <span class=\"sense\">(in newspaper)</span>",
+                     "target": "Werbung <span class=\"genus\"><acronym title=\"feminine\">f</acronym></span>"},
+                    {"source": "<strong class=\"headword\">advertisement</strong>"}] * 3
+        with collect_diagnostics(warn=False) as diagnostics:
+            translations = parse_translations_parallel(api_raws, max_workers=2, chunk_size=2)
+        # Each distinct string is counted once per chunk
+        assert diagnostics.counts == {"genus": 6}
+        with pytest.warns(UserWarning):
+            assert translations == [Translation(api_raw) for api_raw in api_raws]
+        assert [t.raw for t in translations] == api_raws
+        assert translations[1].source.sense == "in newspaper"
+        assert translations[2].target is None
+
+    def test_keep_raw_false(self):
+        # 'ad', en > fr
+        api_raw = {"source": "<strong class=\"headword\">advertisement</strong>",
+                   "target": "publicit\u00e9"}
+        translations = parse_translations_parallel([api_raw], max_workers=1, keep_raw=False)
+        assert translations[0].raw is None
+        assert translations[0].source.raw is None
+        assert translations == [Translation(api_raw)]
+
+    def test_empty(self):
+        assert parse_translations_parallel([], max_workers=1) == []
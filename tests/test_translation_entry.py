@@ -1,12 +1,15 @@
 # -*- coding: utf-8 -*-
 
 # import built-in module
+import warnings
 
 # import third-party modules
 import pytest
 
 # import your own module
-from pons_dictionary.translation_entry import TranslationEntry
+import pons_dictionary.translation_entry
+from pons_dictionary.translation_entry import AcronymResolver, TranslationEntry, collect_diagnostics, \
+    disable_parse_cache, enable_parse_cache, get_acronym_resolver, parse_cache_info, set_acronym_resolver
 
 
 class TestTranslationEntry:
@@ -119,6 +122,233 @@ class TestTranslationEntry:
             te = TranslationEntry(api_raw)
             assert te.text == "test"
 
+    def test_warning_names_class(self):
+        # 'ad', en > de
+        api_raw = 'Werbung <span class="genus"><acronym title="feminine">f</acronym></span>, Anzeige <span class="genus"><acronym title="feminine">f</acronym></span>'
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("default")
+            TranslationEntry(api_raw)
+        assert [str(w.message) for w in caught] == [
+            'Unexpected pattern found in API str (<span class="genus">), removed from API str.']
+
+    def test_collect_diagnostics(self):
+        # 'ad', en > de, and 'big', en > fr (adapted)
+        api_raws = ['Werbung <span class="genus"><acronym title="feminine">f</acronym></span>, Anzeige <span class="genus"><acronym title="masculine">m</acronym></span>',
+                    'a big eater <span class="example">inf</span> <span class="grammar VERB">v</span>']
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            with collect_diagnostics() as diagnostics:
+                for api_raw in api_raws:
+                    TranslationEntry(api_raw)
+                with collect_diagnostics() as inner_diagnostics:
+                    TranslationEntry(api_raws[0])
+                assert inner_diagnostics.counts == {"genus": 2}
+                assert len(caught) == 0
+        assert diagnostics.counts == {"genus": 4, "example": 1}
+        assert diagnostics.samples == {"genus": '<span class="genus"><acronym title="feminine">f</acronym></span>',
+                                       "example": '<span class="example">inf</span>'}
+        assert len(diagnostics) == 5
+        assert [str(w.message) for w in caught] == [
+            "Unexpected patterns found in API strs, removed from API strs: "
+            "genus (4, e.g. <span class=\"genus\"><acronym title=\"feminine\">f</acronym></span>), "
+            "example (1, e.g. <span class=\"example\">inf</span>)."]
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            with collect_diagnostics(warn=False) as diagnostics:
+                TranslationEntry(api_raws[0])
+        assert diagnostics.counts == {"genus": 2}
+
+    def test_lazy(self, mocker):
+        spy = mocker.spy(pons_dictionary.translation_entry, "_parse")
+        # 'ad', en > fr
+        api_raw = '<strong class="headword">advertisement</strong> <span class="sense">(in newspaper)</span>'
+        te = TranslationEntry(api_raw, lazy=True)
+        assert spy.call_count == 0
+        assert te.raw == api_raw
+        assert spy.call_count == 0
+        assert te.text == 'advertisement'
+        assert te.type == 'headword'
+        assert te.sense == 'in newspaper'
+        assert spy.call_count == 1
+
+    def test_lazy_warning_on_access(self):
+        # invented string with unhandled tag
+        api_raw = 'test <span class="UNHANDLED"><acronym title="neuter">nt</acronym></span>'
+        te = TranslationEntry(api_raw, lazy=True)
+        with pytest.warns(UserWarning):
+            assert te.text == "test"
+
+    def test_read_only(self):
+        # 'ad', en > fr
+        te = TranslationEntry('<strong class="headword">advertisement</strong>')
+        with pytest.raises(AttributeError):
+            te.text = 'publicity'
+        with pytest.raises(AttributeError):
+            te.new_attribute = 'value'
+
+    def test_eq_and_hash(self):
+        # 'ad', en > fr
+        api_raw = '<strong class="headword">advertisement</strong> <span class="sense">(in newspaper)</span>'
+        te_1 = TranslationEntry(api_raw)
+        te_2 = TranslationEntry(api_raw, lazy=True)
+        te_3 = TranslationEntry('<strong class="headword">advertisement</strong>')
+        te_4 = TranslationEntry(api_raw, keep_raw=False)
+        assert te_1 == te_2
+        assert hash(te_1) == hash(te_2)
+        assert te_1 != te_3
+        assert te_1 == te_4
+        assert len({te_1, te_2, te_3, te_4}) == 2
+
+    def test_keep_raw_false(self):
+        # 'ad', en > fr
+        api_raw = '<strong class="headword">advertisement</strong> <span class="sense">(in newspaper)</span>'
+        te = TranslationEntry(api_raw, keep_raw=False)
+        assert te.raw is None
+        assert te.text == 'advertisement'
+        assert te.sense == 'in newspaper'
+        with pytest.raises(ValueError):
+            TranslationEntry(api_raw, lazy=True, keep_raw=False)
+
+    def test_field_values_are_shared(self):
+        # 'big', en > fr
+        api_raw = '<span class="example">a <strong class="tilde">big</strong> eater</span> <span class="style"><acronym title="informal">inf</acronym></span>'
+        te_1 = TranslationEntry(api_raw)
+        te_2 = TranslationEntry("".join(list(api_raw)))
+        assert te_1.style is te_2.style
+        assert te_1.type is te_2.type
+
+    def test_free_form_values_not_interned(self):
+        # Free-form values are many, interning them would keep them alive
+        api_raw = '<strong class="headword">bank</strong> <span class="sense">(of river)</span> <span class="genus">m</span>'
+        with collect_diagnostics(warn=False):
+            te_1 = TranslationEntry(api_raw)
+            te_2 = TranslationEntry("".join(list(api_raw)))
+        assert te_1.sense == te_2.sense == "of river"
+        assert te_1.sense is not te_2.sense
+        assert te_1.hints == te_2.hints == ["m"]
+
+    def test_acronym_resolver(self):
+        # 'big', en > fr
+        api_raw = '<span class="example">to be <strong class="tilde">big</strong> on <acronym title="something">sth</acronym></span> <span class="region"><acronym title="American English" class="Am">Am</acronym></span>'
+        te = TranslationEntry(api_raw)
+        assert te.text == 'to be big on <acronym title="something">sth</acronym>'
+        assert te.region == "American English"
+
+        resolver = AcronymResolver(text="expand", fields="abbreviate")
+        assert resolver.resolve(te, "text") == "to be big on something"
+        assert resolver.resolve(te, "region") == "Am"
+        assert resolver.resolve(te, "type") == "example"
+        resolver = AcronymResolver(text="abbreviate", region="expand", style="abbreviate")
+        assert resolver.resolve(te, "text") == "to be big on sth"
+        assert resolver.resolve(te, "region") == "American English"
+
+    def test_acronym_forms_bounded(self):
+        # Forms of distinct free-form values are not all kept
+        resolve_acronym = pons_dictionary.translation_entry._resolve_acronym
+        for i in range(resolve_acronym.cache_info().maxsize + 10):
+            te = TranslationEntry(f'word <span class="sense">(of <acronym title="something">sth</acronym> {i})</span>')
+            assert te.sense == f'of <acronym title="something">sth</acronym> {i}'
+        assert resolve_acronym.cache_info().currsize == resolve_acronym.cache_info().maxsize
+
+    def test_set_acronym_resolver(self, mocker):
+        # 'unternehmen', de > fr
+        api_raw = 'gemischtwirtschaftliches <strong class="tilde">Unternehmen</strong> <span class="grammar SUBST"><acronym title="neuter">nt</acronym></span> <span class="topic"><acronym title="commerce">COMM</acronym></span>, <span class="topic"><acronym title="law">LAW</acronym></span>'
+        te = TranslationEntry(api_raw)
+        spy = mocker.spy(pons_dictionary.translation_entry, "_parse")
+        try:
+            set_acronym_resolver(AcronymResolver(topic="abbreviate"))
+            assert te.topic == ["COMM", "LAW"]
+            assert TranslationEntry(api_raw).topic == ["COMM", "LAW"]
+        finally:
+            set_acronym_resolver(None)
+        assert te.topic == ["commerce", "law"]
+        assert get_acronym_resolver().resolve(te, "topic") == ["commerce", "law"]
+        assert spy.call_count == 1
+
+    def test_hints(self):
+        # 'ad', en > de
+        api_raw = 'Werbung <span class="genus"><acronym title="feminine">f</acronym></span>, Anzeige <span class="genus"><acronym title="feminine">f</acronym></span>'
+        with pytest.warns(UserWarning):
+            te = TranslationEntry(api_raw)
+        assert te.text == "Werbung , Anzeige"
+        assert te.text_with_hints == 'Werbung (<acronym title="feminine">f</acronym>), Anzeige (<acronym title="feminine">f</acronym>)'
+        assert te.hints == ['<acronym title="feminine">f</acronym>'] * 2
+        resolver = AcronymResolver(text="expand")
+        assert resolver.resolve(te, "text_with_hints") == "Werbung (feminine), Anzeige (feminine)"
+        assert resolver.resolve(te, "hints") == ["feminine", "feminine"]
+
+    def test_hints_nested(self):
+        # 'aimer', fr > de (adapted)
+        api_raw = '<span class="example">qui s&#39;aime se taquine <span class="grammar VERB"><span class="style">(refl)</span></span></span> <span class="genus">f</span>'
+        te = TranslationEntry(api_raw)
+        assert te.text == "qui s&#39;aime se taquine"
+        assert te.style == "(refl)"
+        assert te.text_with_hints == "qui s&#39;aime se taquine (f)"
+        assert te.hints == ["f"]
+
+    def test_hints_nested_field(self):
+        api_raw = '<strong class="headword">hw</strong> <span class="example">x <span class="region">BRIT</span></span>'
+        with collect_diagnostics(warn=False) as diagnostics:
+            te = TranslationEntry(api_raw)
+        assert te.text == "hw"
+        assert te.region == "BRIT"
+        assert te.hints == ["x"]
+        assert te.text_with_hints == "hw (x)"
+        assert diagnostics.counts == {"example": 1}
+
+    def test_hints_after_headword(self):
+        # 'Anzeige', de > en
+        api_raw = '<strong class="headword">Anzeige</strong> <span class="genus"><acronym title="feminine">f</acronym></span>'
+        with collect_diagnostics(warn=False) as diagnostics:
+            te = TranslationEntry(api_raw)
+        assert te.text == "Anzeige"
+        assert te.type == "headword"
+        assert te.hints == ['<acronym title="feminine">f</acronym>']
+        assert te.text_with_hints == 'Anzeige (<acronym title="feminine">f</acronym>)'
+        assert diagnostics.counts == {"genus": 1}
+
+    def test_no_hints(self):
+        # 'ad', en > fr
+        api_raw = '<strong class="headword">advertisement</strong> <span class="sense">(in newspaper)</span>'
+        te = TranslationEntry(api_raw)
+        assert te.text_with_hints == te.text == "advertisement"
+        assert te.hints is None
+        assert TranslationEntry("publicité").hints is None
+
+    def test_acronym_resolver_invalid(self):
+        with pytest.raises(ValueError):
+            AcronymResolver(text="shorten")
+        with pytest.raises(ValueError):
+            AcronymResolver(fields="keep")
+        with pytest.raises(ValueError):
+            AcronymResolver(genus="abbreviate")
+
+    def test_parse_cache(self):
+        # 'unternehmen', de > fr
+        api_raw = 'gemischtwirtschaftliches <strong class="tilde">Unternehmen</strong> <span class="grammar SUBST"><acronym title="neuter">nt</acronym></span> <span class="topic"><acronym title="commerce">COMM</acronym></span>, <span class="topic"><acronym title="law">LAW</acronym></span>'
+        assert parse_cache_info() is None
+        enable_parse_cache(maxsize=1)
+        try:
+            te_1 = TranslationEntry(api_raw)
+            te_2 = TranslationEntry(api_raw)
+            assert te_1._parsed is te_2._parsed
+            assert parse_cache_info().hits == 1
+            assert parse_cache_info().misses == 1
+
+            # Multiple values are returned as a new list, the cached result is not modified
+            te_1.topic.append('finance')
+            assert te_2.topic == ['commerce', 'law']
+
+            # Least recently used result is evicted
+            TranslationEntry('<strong class="headword">advertisement</strong>')
+            TranslationEntry(api_raw)
+            assert parse_cache_info().misses == 3
+            assert parse_cache_info().currsize == 1
+        finally:
+            disable_parse_cache()
+        assert parse_cache_info() is None
+
     def test_str_(self):
         # 'unternehmen', de > fr
         api_raw = 'gemischtwirtschaftliches <strong class="tilde">Unternehmen</strong> <span class="grammar SUBST"><acronym title="neuter">nt</acronym></span> <span class="topic"><acronym title="commerce">COMM</acronym></span>, <span class="topic"><acronym title="law">LAW</acronym></span>'
@@ -128,4 +358,79 @@ class TestTranslationEntry:
 
     # Test for specific strings, essentially problematic corner cases
     def test_corner_string_1(self):
-        pass
\ No newline at end of file
+        pass
+
+    def test_corner_several_hints_in_text(self):
+        # 'ad', en > de
+        api_raw = 'Werbung <span class="genus"><acronym title="feminine">f</acronym></span>, Anzeige <span class="genus"><acronym title="feminine">f</acronym></span>'
+        with pytest.warns(UserWarning):
+            te = TranslationEntry(api_raw)
+        assert te.text == "Werbung , Anzeige"
+        assert te.type is None
+
+    def test_corner_sense_without_parenthesis(self):
+        # invented string, sense is not in parenthesis and therefore kept as a hint
+        api_raw = '<strong class="headword">bank</strong> <span class="sense">of river</span>'
+        with pytest.warns(UserWarning):
+            te = TranslationEntry(api_raw)
+        assert te.text == "bank"
+        assert te.sense is None
+        assert te.hints == ["of river"]
+        assert te.text_with_hints == "bank (of river)"
+
+    def test_corner_sense_without_parenthesis_in_text(self):
+        # invented string, sense is not in parenthesis and therefore removed as an unexpected span
+        api_raw = 'bank <span class="sense">of river</span>'
+        with pytest.warns(UserWarning):
+            te = TranslationEntry(api_raw)
+        assert te.text == "bank"
+        assert te.sense is None
+
+    def test_span_rules(self, monkeypatch):
+        # 'ad', en > de
+        api_raw = 'Werbung <span class="genus"><acronym title="feminine">f</acronym></span>, Anzeige <span class="genus"><acronym title="feminine">f</acronym></span>'
+        monkeypatch.setitem(pons_dictionary.translation_entry._SPAN_RULES, "genus",
+                            pons_dictionary.translation_entry._SpanRule(None))
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            te = TranslationEntry(api_raw)
+        assert te.text == "Werbung , Anzeige"
+
+        monkeypatch.setitem(pons_dictionary.translation_entry._SPAN_RULES, "genus",
+                            pons_dictionary.translation_entry._SpanRule("category"))
+        assert TranslationEntry(api_raw).category == ["feminine", "feminine"]
+
+    @pytest.mark.parametrize("api_raw", [
+        # 'ad', en > fr
+        'publicité <span class="genus"><acronym title="feminine">f</acronym></span>',
+        # 'live', en > fr
+        'en chair et en os',
+        # 'aimer', fr > de
+        'was sich liebt, das neckt sich',
+        # 'big', en > fr
+        'a big eater <span class="style"><acronym title="informal">inf</acronym></span>',
+        # 'ad', en > fr (adapted)
+        'advertisement <span class="sense">(in newspaper)</span>',
+        'advertisement <span class="sense">in newspaper</span>',
+        'advertisement <span class="grammar SUBST"><acronym title="neuter">nt</acronym></span>',
+        'advertisement, <span class="genus"><span class="style">inf</span></span>',
+        '<span class="genus">f</span>',
+    ])
+    def test_fast_path(self, api_raw):
+        with warnings.catch_warnings(record=True) as fast_path_warnings:
+            warnings.simplefilter("always")
+            parsed = pons_dictionary.translation_entry._parse_api_str(api_raw)
+        with warnings.catch_warnings(record=True) as full_parse_warnings:
+            warnings.simplefilter("always")
+            expected = pons_dictionary.translation_entry._parse_tags(api_raw)
+        assert parsed == expected
+        assert [str(w.message) for w in fast_path_warnings] == [str(w.message) for w in full_parse_warnings]
+
+    def test_corner_multiple_fields(self):
+        # 'go', en > fr (adapted)
+        api_raw = '<strong class="headword">go</strong> <span class="style"><acronym title="informal">inf</acronym></span> <span class="region"><acronym title="British English" class="Brit">Brit</acronym></span>'
+        te = TranslationEntry(api_raw)
+        assert te.text == "go"
+        assert te.type == "headword"
+        assert te.style == "informal"
+        assert te.region == "British English"
\ No newline at end of file